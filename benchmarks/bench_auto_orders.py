@@ -0,0 +1,78 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+# auto_orders 性能测试：
+# 对比完整网格顺序搜索、提前结束、进程池并行，以及缓存命中后的重复运行耗时。
+# 数据使用 szdatasets.tstest （M4小时数据），只有数据文件不存在时才使用带24小时周期的合成序列。
+# 提前结束（patience）可能错过AIC更小的高阶模型，same as full 列显示结果是否与完整搜索一致。
+# 用法：python benchmarks/bench_auto_orders.py [--series 3] [--length 240] [--workers 4]
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from pytoolsz.forecast import auto_orders, fitMemo
+
+def load_series(n:int, length:int) -> tuple[str, list[pd.Series]]:
+    """返回 (数据来源, 序列列表)，只有数据文件不存在时才使用合成序列。"""
+    from szdatasets import tstest
+    try :
+        data = tstest.data().get()
+    except FileNotFoundError as e :
+        print("tstest data not found ({}), using synthetic series.".format(e))
+        rng = np.random.default_rng(11)
+        t = np.arange(length)
+        return "synthetic", [pd.Series(100 + 10*np.sin(2*np.pi*t/24) + 0.05*t + rng.normal(0, 1, length))
+                             for _ in range(n)]
+    res = []
+    for _, group in data.group_by("item_id", maintain_order=True):
+        res.append(group.get_column("target").tail(length).to_pandas())
+        if len(res) >= n :
+            break
+    return "szdatasets.tstest", res
+
+def run(series:list[pd.Series], **kwargs) -> tuple[float, list]:
+    t0 = time.perf_counter()
+    res = [auto_orders(x, diff_max=5, **kwargs) for x in series]
+    return time.perf_counter() - t0, res
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="auto_orders benchmark")
+    parser.add_argument("--series", type=int, default=3)
+    parser.add_argument("--length", type=int, default=240)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    source, series = load_series(args.series, args.length)
+    print("input: {}, {} series x {} points".format(source, len(series), args.length))
+    memo = fitMemo()
+    full = None
+    print("{:<30}{:>10}{:>12}  {}".format("mode", "seconds", "same as full", "orders"))
+    for name, kwargs in [
+        ("serial, full grid", dict(n_workers=1, patience=None, memo=False)),
+        ("serial, early stop", dict(n_workers=1, patience=2, memo=False)),
+        ("pool, full grid", dict(n_workers=args.workers, patience=None, memo=False)),
+        ("pool, early stop (cold memo)", dict(n_workers=args.workers, patience=2, memo=memo)),
+        ("pool, early stop (warm memo)", dict(n_workers=args.workers, patience=2, memo=memo)),
+    ]:
+        elapsed, res = run(series, **kwargs)
+        full = res if full is None else full
+        print("{:<30}{:>10.3f}{:>12}  {}".format(name, elapsed, str(res == full), res[0]))
+    print(memo)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+# 启动性能测试：
+# 每个导入目标都在全新的子进程中执行，记录冷启动导入耗时与进程常驻内存(RSS)。
+# 用法：python benchmarks/bench_import.py [--repeat 3]
+
+import argparse
+import json
+import subprocess
+import sys
+
+TARGETS = [
+    "pytoolsz",
+    "pytoolsz.frame",
+    "pytoolsz.pretools",
+    "pytoolsz.compress",
+    "pytoolsz.utils",
+    "pytoolsz.saveExcel",
+    "pytoolsz.utob",
+    "pytoolsz.handlepath",
+    "pytoolsz.tsTools",
+    "pytoolsz.forecast",
+    "pytoolsz.graph",
+    "pytoolsz.ppTrans",
+]
+
+_PROBE = """
+import json, time
+def _rss():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        import resource, sys
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+base = _rss()
+t0 = time.perf_counter()
+err = None
+try:
+    import {target}
+except Exception as e:
+    err = "{{}}: {{}}".format(type(e).__name__, e)
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "rss": _rss(), "rss_delta": _rss() - base, "error": err}}))
+"""
+
+def probe(target:str) -> dict:
+    out = subprocess.run([sys.executable, "-c", _PROBE.format(target=target)],
+                         capture_output=True, text=True)
+    if out.returncode != 0 or not out.stdout.strip():
+        return {"seconds": None, "rss": None, "rss_delta": None,
+                "error": out.stderr.strip().splitlines()[-1] if out.stderr else "failed"}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pytoolsz cold-import benchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print("{:<22}{:>12}{:>14}{:>14}  {}".format("target", "seconds", "rss(MB)", "delta(MB)", "error"))
+    for target in TARGETS:
+        runs = [probe(target) for _ in range(args.repeat)]
+        oks = [r for r in runs if r["error"] is None]
+        if oks:
+            best = min(oks, key=lambda r: r["seconds"])
+            print("{:<22}{:>12.3f}{:>14.1f}{:>14.1f}".format(
+                target, best["seconds"], best["rss"]/2**20, best["rss_delta"]/2**20))
+        else:
+            print("{:<22}{:>12}{:>14}{:>14}  {}".format(target, "-", "-", "-", runs[-1]["error"]))
+
+if __name__ == "__main__":
+    main()
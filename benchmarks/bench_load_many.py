@@ -0,0 +1,72 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+# load_many 性能测试：
+# 对比逐个 szDataFrame + append(vstack) 的循环与线程池并行读取、一次性合并的吞吐量。
+# 用法：python benchmarks/bench_load_many.py [--files 200] [--rows 20000]
+
+import argparse
+import time
+import numpy as np
+import polars as pl
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from pytoolsz.frame import szDataFrame, load_many
+
+def make_files(root:Path, files:int, rows:int) -> None:
+    rng = np.random.default_rng(7)
+    for i in range(files):
+        pl.DataFrame({
+            "日期": np.full(rows, i),
+            "频道": rng.integers(0, 100, rows),
+            "观看次数": rng.integers(0, 10**6, rows),
+            "收入": rng.random(rows) * 100,
+        }).write_csv(root/"daily_{:04d}.csv".format(i))
+
+def loop_append(root:Path) -> pl.DataFrame:
+    data = None
+    for xfile in sorted(root.glob("*.csv")):
+        tmp = szDataFrame(xfile)
+        data = tmp if data is None else data.append(tmp)
+    return data.get()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="load_many benchmark")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    with TemporaryDirectory() as root:
+        root = Path(root)
+        make_files(root, args.files, args.rows)
+        total = args.files * args.rows
+        print("{:<28}{:>10}{:>16}".format("mode", "seconds", "rows/s"))
+        for name, func in [
+            ("szDataFrame.append loop", lambda: loop_append(root)),
+            ("load_many", lambda: load_many(root/"*.csv", max_workers=args.workers)),
+            ("load_many + source col", lambda: load_many(root/"*.csv", max_workers=args.workers,
+                                                         source_column="文件")),
+        ]:
+            t0 = time.perf_counter()
+            res = func()
+            elapsed = time.perf_counter() - t0
+            assert res.height == total
+            print("{:<28}{:>10.3f}{:>16,.0f}".format(name, elapsed, total/elapsed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+# saveExcel 性能测试：
+# 用结算表的典型格式（标题、带样式的表头与数据行、数字格式、总计行）写出同一份数据，
+# 对比普通模式与 write_only 流式模式的每秒行数与进程峰值内存。每种模式在独立子进程中运行。
+# write_only 的优势是峰值内存；没有安装 lxml 时两种模式都使用openpyxl的纯Python XML输出，速度相近。
+# 用法：python benchmarks/bench_saveexcel.py [--rows 50000] [--cols 12]
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+MODES = ["normal", "write_only"]
+
+BORDER = {"left": {"left": {"border_style": "thick"}},
+          "middle": {"top": {"border_style": None}},
+          "right": {"right": {"border_style": "thick"}}}
+
+def _peak_rss() -> int:
+    try :
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    except ImportError :
+        import psutil
+        return psutil.Process().memory_info().peak_wset
+
+def run(mode:str, rows:int, cols:int, target:str) -> dict:
+    import numpy as np
+    import polars as pl
+    from openpyxl.utils.cell import get_column_letter
+    from pytoolsz.saveExcel import saveExcel
+    rng = np.random.default_rng(5)
+    data = pl.DataFrame({"渠道": rng.choice(["A", "B", "C"], rows)} | 
+                        {"指标{}".format(i): rng.random(rows) * 1000 for i in range(1, cols)})
+    formats = {get_column_letter(i): "#,##0.00" for i in range(2, cols + 1)}
+    base = _peak_rss()
+    t0 = time.perf_counter()
+    with saveExcel(target, startRow=2, startColumn=2, write_only=(mode == "write_only")) as writer:
+        writer.usingData(data)
+        writer.actionNewSheet(sheetname="结算")
+        writer.setColumnsWidth(16)
+        writer.writeTitle("结算表")
+        writer.writeData(col_font_type={"fill": {"patternType": "solid", "fgColor": "000066CC"}},
+                         col_border_type=BORDER,
+                         font_type={"font": {"name": "微软雅黑", "size": 11.5}},
+                         borde_type=BORDER, numberformat=formats)
+        writer.writeSummaryData(name_merge_cols=["渠道"], numberformat="#,##0.00", borde_type=BORDER)
+    elapsed = time.perf_counter() - t0
+    return {"seconds": elapsed, "peak_rss": _peak_rss(), "rss_delta": _peak_rss() - base}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="saveExcel benchmark")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--cols", type=int, default=12)
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    parser.add_argument("--target", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child :
+        print(json.dumps(run(args.child, args.rows, args.cols, args.target)))
+        return
+    from tempfile import TemporaryDirectory
+    print("{:<14}{:>10}{:>14}{:>16}".format("mode", "seconds", "rows/s", "peak RSS(MB)"))
+    with TemporaryDirectory() as root:
+        for mode in args.modes:
+            out = subprocess.run([sys.executable, __file__, "--child", mode, "--rows", str(args.rows),
+                                  "--cols", str(args.cols), "--target", "{}/{}.xlsx".format(root, mode)],
+                                 capture_output=True, text=True)
+            if out.returncode != 0 :
+                print("{:<14}failed: {}".format(mode, out.stderr.strip().splitlines()[-1]))
+                continue
+            res = json.loads(out.stdout.strip().splitlines()[-1])
+            print("{:<14}{:>10.3f}{:>14,.0f}{:>16.1f}".format(
+                mode, res["seconds"], args.rows / res["seconds"], res["peak_rss"] / 2**20))
+
+if __name__ == "__main__":
+    main()
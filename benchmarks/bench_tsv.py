@@ -0,0 +1,75 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+# read_tsv 性能测试：
+# 对比全字符串读取后再转换类型（旧方式）、类型推断、指定类型、内存映射与惰性扫描。
+# 用法：python benchmarks/bench_tsv.py [--rows 3000000]
+
+import argparse
+import time
+import numpy as np
+import polars as pl
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from pytoolsz.frame import read_tsv, scan_tsv
+
+SCHEMA = {"日期": pl.Date, "频道": pl.Int64, "观看次数": pl.Int64, "收入": pl.Float64, "国家": pl.Utf8}
+
+def make_tsv(target:Path, rows:int) -> None:
+    rng = np.random.default_rng(3)
+    pl.DataFrame({
+        "日期": pl.date_range(pl.date(2020,1,1), pl.date(2024,12,31), eager=True)
+                 .sample(rows, with_replacement=True, seed=3),
+        "频道": rng.integers(0, 1000, rows),
+        "观看次数": rng.integers(0, 10**6, rows),
+        "收入": rng.random(rows) * 100,
+        "国家": rng.choice(["CN", "US", "JP", "DE"], rows),
+    }).write_csv(target, separator="\t")
+
+def legacy(target:Path) -> pl.DataFrame:
+    return read_tsv(target).with_columns(
+        [pl.col("日期").str.to_date()] + 
+        [pl.col(k).cast(v) for k,v in SCHEMA.items() if k != "日期"])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="read_tsv benchmark")
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    with TemporaryDirectory() as root:
+        target = Path(root)/"export.tsv"
+        make_tsv(target, args.rows)
+        print("file: {:.1f} MB, {:,} rows".format(target.stat().st_size/2**20, args.rows))
+        print("{:<34}{:>10}{:>14}".format("mode", "seconds", "frame(MB)"))
+        for name, func in [
+            ("all Utf8 + cast (legacy)", lambda: legacy(target)),
+            ("infer_schema=True", lambda: read_tsv(target, infer_schema=True)),
+            ("schema=SCHEMA", lambda: read_tsv(target, schema=SCHEMA)),
+            ("schema=SCHEMA, memory_map", lambda: read_tsv(target, schema=SCHEMA, memory_map=True)),
+            ("scan_tsv, 2 columns", lambda: scan_tsv(target, infer_schema=True)
+                                            .select("频道", "收入").collect()),
+        ]:
+            best, res = float("inf"), None
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                res = func()
+                best = min(best, time.perf_counter() - t0)
+            print("{:<34}{:>10.3f}{:>14.1f}".format(name, best, res.estimated_size("mb")))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+# zipreader 性能测试：
+# 对比旧的“全部解压到临时目录再读取”与按需读取单个成员的耗时和磁盘写入量。
+# 用法：python benchmarks/bench_zipreader.py [--rows 200000] [--members 8]
+
+import argparse
+import tempfile
+import time
+import zipfile
+import numpy as np
+import polars as pl
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+from pytoolsz.frame import zipreader
+
+def _dir_bytes(path:Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+def extract_all_read(zipFilepath:Path, subFile:str) -> tuple[pl.DataFrame, int]:
+    """旧实现：extractall 后读取，返回数据与写入磁盘的字节数。"""
+    with TemporaryDirectory() as tmpdirname:
+        with zipfile.ZipFile(zipFilepath, "r") as teZip:
+            teZip.extractall(path = tmpdirname)
+        written = _dir_bytes(Path(tmpdirname))
+        return pl.read_csv(Path(tmpdirname)/subFile), written
+
+class _countingFile(object):
+    """包装临时文件，统计写入的字节数。"""
+    def __init__(self, fh, counter:list[int]) -> None:
+        self.__fh = fh
+        self.__counter = counter
+    def write(self, data) -> int:
+        size = self.__fh.write(data)
+        self.__counter[0] += size
+        return size
+    def __getattr__(self, name:str):
+        return getattr(self.__fh, name)
+
+def disk_written(func) -> int:
+    """
+    运行 func 并返回写入临时文件的字节数。
+    SpooledTemporaryFile 超过上限后通过 tempfile.TemporaryFile 落盘，这里替换该函数计数。
+    """
+    counter = [0]
+    origin = tempfile.TemporaryFile
+    with mock.patch("tempfile.TemporaryFile", 
+                    lambda *args, **kwgs: _countingFile(origin(*args, **kwgs), counter)):
+        func()
+    return counter[0]
+
+def make_archive(root:Path, rows:int, members:int) -> Path:
+    rng = np.random.default_rng(42)
+    target = root/"export.zip"
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for i in range(members):
+            frame = pl.DataFrame({
+                "日期": np.arange(rows) % 365,
+                "观看次数": rng.integers(0, 10**6, rows),
+                "收入": rng.random(rows) * 100,
+            })
+            archive.writestr("表格数据{}.csv".format(i if i else ""), frame.write_csv())
+    return target
+
+def timeit(func, repeat:int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="zipreader benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--members", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    with TemporaryDirectory() as root:
+        archive = make_archive(Path(root), args.rows, args.members)
+        with zipfile.ZipFile(archive) as zf:
+            member = zf.getinfo("表格数据.csv").file_size
+        _, old_written = extract_all_read(archive, "表格数据.csv")
+        new_written = disk_written(lambda: zipreader(archive, "表格数据.csv"))
+        spooled_written = disk_written(lambda: zipreader(archive, "表格数据.csv", spool_size=2**20))
+        old = timeit(lambda: extract_all_read(archive, "表格数据.csv"), args.repeat)
+        new = timeit(lambda: zipreader(archive, "表格数据.csv"), args.repeat)
+        spooled = timeit(lambda: zipreader(archive, "表格数据.csv", spool_size=2**20), args.repeat)
+        print("archive: {:.1f} MB, {} members, target member {:.1f} MB".format(
+            archive.stat().st_size/2**20, args.members, member/2**20))
+        print("{:<24}{:>10}{:>18}".format("mode", "seconds", "disk written(MB)"))
+        print("{:<24}{:>10.3f}{:>18.1f}".format("extractall", old, old_written/2**20))
+        print("{:<24}{:>10.3f}{:>18.1f}".format("member (memory)", new, new_written/2**20))
+        print("{:<24}{:>10.3f}{:>18.1f}".format("member (spooled 1MB)", spooled, spooled_written/2**20))
+
+if __name__ == "__main__":
+    main()
@@ -15,26 +15,69 @@
 # MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
 # See the Mulan PSL v2 for more details.
 
-from pytoolsz.frame import (
-    getreader,
-    just_load,
-    szDataFrame,
-    zipreader
-)
-import szdatasets as datasetsz
-import pytoolsz.pretools as pretools
-import pytoolsz.compress as compress
-import pytoolsz.handlepath as handlepath
-import pytoolsz.ppTrans as ppTrans
-import pytoolsz.utils as utils
-import pytoolsz.graph as graph
-import pytoolsz.tsTools as tsTools
-import pytoolsz.forecast as forecast
+# 子模块按需加载：`import pytoolsz` 时不再导入 graph/forecast/ppTrans 等重依赖，
+# 仅在首次访问对应属性时才真正导入。
+import importlib
+
+from typing import TYPE_CHECKING
+
+_LAZY_MODULES = {
+    "datasetsz": "szdatasets",
+    "pretools": "pytoolsz.pretools",
+    "compress": "pytoolsz.compress",
+    "handlepath": "pytoolsz.handlepath",
+    "ppTrans": "pytoolsz.ppTrans",
+    "utils": "pytoolsz.utils",
+    "graph": "pytoolsz.graph",
+    "tsTools": "pytoolsz.tsTools",
+    "forecast": "pytoolsz.forecast",
+}
+
+_LAZY_ATTRS = {
+    "getreader": "pytoolsz.frame",
+    "just_load": "pytoolsz.frame",
+    "szDataFrame": "pytoolsz.frame",
+    "zipreader": "pytoolsz.frame",
+}
+
+# saveExcel 既是子模块名又是类名：子模块一旦被导入，导入系统会把模块对象绑定到
+# pytoolsz.saveExcel ，__getattr__ 不再被调用。因此这里与原来一样直接导入并绑定类。
 from pytoolsz.saveExcel import (
     saveExcel,
     transColname2Letter
 )
 
+if TYPE_CHECKING :
+    from pytoolsz.frame import (
+        getreader,
+        just_load,
+        szDataFrame,
+        zipreader
+    )
+    import szdatasets as datasetsz
+    import pytoolsz.pretools as pretools
+    import pytoolsz.compress as compress
+    import pytoolsz.handlepath as handlepath
+    import pytoolsz.ppTrans as ppTrans
+    import pytoolsz.utils as utils
+    import pytoolsz.graph as graph
+    import pytoolsz.tsTools as tsTools
+    import pytoolsz.forecast as forecast
+
+def __getattr__(name:str) -> any:
+    """首次访问时导入子模块或对象，并缓存到包的命名空间中。"""
+    if name in _LAZY_MODULES :
+        res = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_ATTRS :
+        res = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else :
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = res
+    return res
+
+def __dir__() -> list[str]:
+    return sorted(set(globals().keys()) | set(__all__))
+
 __version__ = "0.3.14"
 
 def version(println:bool = True, 
@@ -70,6 +113,7 @@ __all__ = [
 
 if __name__ == "__main__":
     from pytoolsz.utils import print_special
+    import szdatasets as datasetsz
     version()
     print_special(datasetsz.iris.NOTE, mode="markdown")
     print(datasetsz.iris.data())
\ No newline at end of file
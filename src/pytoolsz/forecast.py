@@ -29,82 +29,521 @@
 # 2. prophet ：传统时序模型的集大成者，减少前序处理程度，并提供了更多添加属性，使时序预测更准确。
 
 from itertools import product
-from typing import Union
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Union, Callable
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from threading import RLock
 from prophet import Prophet
 from prophet.plot import add_changepoints_to_plot
-from statsmodels.tsa.stattools import adfuller,arma_order_select_ic
+from statsmodels.tsa.stattools import adfuller,kpss,arma_order_select_ic
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 
-from pytoolsz.tsTools import tsFrame
+from pytoolsz.tsTools import tsFrame, tsPanel
 from pytoolsz.frame import szDataFrame
 
 import pmdarima as pm
+import os
+import json
+import logging
+import time
+import hashlib
+import warnings
 import importlib
+import multiprocessing
 
 import pandas as pd
 import polars as pl
 import numpy as np
 
-__all__ = ["is_DataFrame", "auto_orders", "help_kwargs", "quickProphet", "quickARIMA"]
+__all__ = ["is_DataFrame", "fitMemo", "batch_diagnostics", "auto_orders", "orderCache", "set_order_cache",
+           "modelStore", "set_model_store", "quickOrders", "help_kwargs", 
+           "prophet_init", "quickProphet", "quickARIMA", "forecast_many"]
 
 def is_DataFrame(obj) -> bool :
     """判断是否为 DataFrame 类型"""
     return isinstance(obj,
                       (pl.DataFrame, pd.DataFrame, tsFrame, szDataFrame))
 
+def _process_pool(n_workers:int|None = None) -> ProcessPoolExecutor:
+    # polars 内部使用多线程，fork 出的子进程可能死锁，这里统一使用 spawn（与Windows一致）。
+    return ProcessPoolExecutor(max_workers=n_workers,
+                               mp_context=multiprocessing.get_context("spawn"))
+
+class fitMemo(object):
+    """
+    模型拟合结果的LRU缓存。
+    键为 (数据指纹, 阶段, 参数...) ，同一条序列重复搜索时直接返回已拟合的结果。
+    """
+    def __init__(self, maxsize:int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__items = OrderedDict()
+        self.__lock = RLock()
+    def __len__(self) -> int:
+        return len(self.__items)
+    def __repr__(self) -> str:
+        return "fitMemo(size={}/{}, hits={}, misses={})".format(
+            len(self.__items), self.maxsize, self.hits, self.misses)
+    def __contains__(self, key:tuple) -> bool:
+        with self.__lock:
+            return key in self.__items
+    def get(self, key:tuple, default = None):
+        with self.__lock:
+            if key not in self.__items :
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.__items.move_to_end(key)
+            return self.__items[key]
+    def set(self, key:tuple, value) -> None:
+        with self.__lock:
+            self.__items[key] = value
+            self.__items.move_to_end(key)
+            while len(self.__items) > self.maxsize :
+                self.__items.popitem(last=False)
+    def clear(self) -> None:
+        with self.__lock:
+            self.__items.clear()
+            self.hits = 0
+            self.misses = 0
+
+FIT_MEMO = fitMemo()
+
+def _fingerprint(values:np.ndarray) -> str:
+    """序列数据的指纹，用于缓存键。"""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+def _sarimax_aic(task:tuple) -> float:
+    """拟合单个候选模型并返回AIC，在子进程中执行；拟合失败时返回inf。"""
+    values, order, seasonal_order, trend = task
+    try :
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model = SARIMAX(values, order=order, seasonal_order=seasonal_order,
+                            trend=trend).fit(disp=False)
+        return float(model.aic)
+    except Exception :
+        return float("inf")
+
+def _diff_matrix(values:np.ndarray, max_lag:int) -> np.ndarray:
+    """
+    一次算出所有滞后阶数的差分矩阵：第 i-1 行为 values[t] - values[t-i] ，前 i 个位置为NaN。
+    与原来的逻辑相同，差分结果中的inf替换为0。序列有缺失值时对应位置也是NaN，
+    检验前需用 _diff_column 去掉。
+    """
+    lags = np.arange(1, max_lag+1)[:, None]
+    t = np.arange(len(values))[None, :]
+    res = np.where(t >= lags, values[t] - values[np.maximum(t - lags, 0)], np.nan)
+    res[np.isposinf(res)] = 0.0
+    return res
+
+def _diff_column(mat:np.ndarray, lag:int) -> np.ndarray:
+    """取出 lag 阶差分并去掉非有限值，与原来的 diff(lag).dropna() 相同。"""
+    col = mat[lag-1, lag:]
+    return col[np.isfinite(col)]
+
+def _diff_order(values:np.ndarray, max_lag:int, 
+                alpha:float = 0.05) -> tuple[int, float, float]:
+    """
+    ADF检验平稳的最小差分滞后阶数，返回 (阶数, ADF统计量, p值) ，都不平稳时阶数为0。
+    """
+    mat = _diff_matrix(values, max_lag)
+    for i in range(1, max_lag+1):
+        adf = adfuller(_diff_column(mat, i))
+        if adf[1] < alpha:
+            return i, float(adf[0]), float(adf[1])
+    return 0, float("nan"), float("nan")
+
+def _seasonal_periods(mat:np.ndarray) -> np.ndarray:
+    """批量FFT：对等长序列矩阵（每行一条序列）按最大振幅的频率推断季节周期，0表示无季节性。"""
+    n = mat.shape[1]
+    x = np.fft.fft(mat, axis=1)
+    xf = np.linspace(0.0,0.5,n//2)
+    dx = xf[np.argmax(np.abs(x[:, 1:(n//2)]), axis=1)]
+    with np.errstate(divide="ignore"):
+        res = np.where(dx == 0.0, 0.0, np.floor_divide(1.0, dx))
+    return res.astype(np.int64)
+
+# 有效观测（非空值）少于该数量的序列不做检验。
+_MIN_DIAG_OBS = 8
+
+def _diagnose_task(task:tuple) -> dict:
+    """单条序列的ADF/KPSS检验，在子进程中执行。"""
+    sid, values, max_lag, alpha = task
+    res = {"id": sid, "n_obs": len(values), "d": None, "adf_stat": None, "adf_pvalue": None,
+           "kpss_stat": None, "kpss_pvalue": None, "error": None}
+    n_valid = int(np.isfinite(values).sum())
+    if n_valid < _MIN_DIAG_OBS :
+        res["error"] = "insufficient data: {} valid observations".format(n_valid)
+        return res
+    try :
+        d, res["adf_stat"], res["adf_pvalue"] = _diff_order(values, min(max_lag, len(values)), alpha)
+        res["d"] = d
+        temp = values[np.isfinite(values)] if d == 0 else _diff_column(_diff_matrix(values, d), d)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            stat, pvalue, *_ = kpss(temp, nlags="auto")
+        res["kpss_stat"], res["kpss_pvalue"] = float(stat), float(pvalue)
+    except Exception as e :
+        res["error"] = "{}: {}".format(type(e).__name__, e)
+    return res
+
+def batch_diagnostics(data:tsPanel|pl.DataFrame|pd.DataFrame|dict, 
+                      id_col:str|None = None, y:str|None = None, dt:str|None = None,
+                      diff_max:int = 40, alpha:float = 0.05, use_log:bool = False,
+                      n_workers:int|None = 1, chunksize:int = 1) -> pl.DataFrame:
+    """
+    多序列平稳性与季节性诊断。
+    差分矩阵一次性用NumPy计算，ADF/KPSS检验按序列在进程池中并行，季节周期对等长序列批量FFT。
+    d、season 的计算方式与 auto_orders 相同，可以直接用于后续的定阶。
+
+    参数:
+        data: tsPanel，长格式数据框（需给出 id_col 与 y ，给出 dt 时按时间排序），或 {id: 序列} 字典。
+        diff_max: 最大差分滞后阶数。
+        alpha: ADF检验的显著性水平。
+        use_log: 先取对数。
+        n_workers: 进程数，默认为1（当前进程中顺序执行），None为CPU核数。
+        chunksize: 每次发送给子进程的序列数量。
+
+    返回:
+        pl.DataFrame: id、n_obs、d（平稳的差分滞后阶数，0表示未找到）、adf_stat、adf_pvalue、
+        kpss_stat、kpss_pvalue（d阶差分后的KPSS检验）、season（FFT季节周期）、error 。
+        有效观测少于8个（包括空序列与全部为空值）的序列不做检验，error 为 "insufficient data: ..." 。
+    """
+    if isinstance(data, tsPanel) :
+        id_col = data.id_col
+        frame = data.to_polars()
+        series = [(k, frame[data.variable].slice(o, n).to_numpy()) for k, o, n in data.index.iter_rows()]
+    elif isinstance(data, dict) :
+        series = list(data.items())
+    else :
+        if id_col is None or y is None :
+            raise ValueError("id_col and y must be provided for a long-format DataFrame.")
+        if isinstance(data, pd.DataFrame) :
+            data = pl.from_pandas(data)
+        data = data.sort(id_col, dt, maintain_order=True) if dt else data
+        groups = data.select(id_col, y).partition_by(id_col, as_dict=True, maintain_order=True)
+        series = [(k[0], v[y].to_numpy()) for k, v in groups.items()]
+    id_col = "id" if id_col is None else id_col
+    series = [(k, np.asarray(v, dtype=np.float64)) for k, v in series]
+    if use_log :
+        series = [(k, np.log(v)) for k, v in series]
+    tasks = [(k, v, diff_max, alpha) for k, v in series]
+    if n_workers == 1 :
+        rows = [_diagnose_task(x) for x in tasks]
+    else :
+        with _process_pool(n_workers) as executor:
+            rows = list(executor.map(_diagnose_task, tasks, chunksize=chunksize))
+    # 按长度分组，每组一次FFT。
+    seasons = [0] * len(series)
+    bylen = {}
+    for i, (_, v) in enumerate(series):
+        if not (rows[i]["error"] or "").startswith("insufficient") :
+            bylen.setdefault(len(v), []).append(i)
+    for n, idx in bylen.items():
+        if n < 4 :
+            continue
+        for i, season in zip(idx, _seasonal_periods(np.stack([series[x][1] for x in idx]))):
+            seasons[i] = int(season)
+    res = pl.DataFrame(rows, schema_overrides={"n_obs": pl.Int64, "d": pl.Int64, 
+                                               "adf_stat": pl.Float64, "adf_pvalue": pl.Float64,
+                                               "kpss_stat": pl.Float64, "kpss_pvalue": pl.Float64,
+                                               "error": pl.Utf8})
+    return res.with_columns(pl.Series("season", seasons, dtype=pl.Int64)).select(
+        pl.col("id").alias(id_col), pl.all().exclude("id", "error"), "error")
+
 def auto_orders(data:pd.Series, diff_max:int = 40, 
-                use_log:bool = False) -> tuple:
+                use_log:bool = False, n_workers:int|None = 1,
+                patience:int|None = None, memo:fitMemo|bool = True) -> tuple:
     """
     自动选择合适时序特征
     目前并不推荐auto_orders方法，因为其计算量过大，且存在所搜范围可能不足的问题。
     除非特殊情况，请选择quickOrders方法来确定arima的模型参数。
+
+    n_workers - 季节性参数网格搜索使用的进程数，默认为1（当前进程中顺序执行），None为CPU核数。
+    patience - 默认None，搜索全部候选。给出时候选模型按复杂度 P+Q 从低到高逐层拟合，
+               连续 patience 层AIC没有改善时提前结束（可能错过更高阶的最优模型）。
+    memo - 拟合结果缓存，True使用模块级的 FIT_MEMO ，False不缓存，也可以传入自己的 fitMemo 。
+           键为(数据指纹, 影响结果的参数)，同一序列重复运行时几乎不需要重新拟合。
     """
+    if memo is True :
+        memo = FIT_MEMO
+    elif memo is False :
+        memo = fitMemo(maxsize=0)
     tdt = np.log(data) if use_log else data
+    values = np.asarray(tdt, dtype=np.float64)
+    key = _fingerprint(values)
     tmax = len(tdt) if diff_max > len(tdt) else diff_max
-    for i in range(1,tmax+1):
-        temp = tdt.diff(i).dropna()
-        if any((temp == np.inf).tolist()):
-            temp[temp == np.inf] = 0.0
-        adf = adfuller(temp)
-        if adf[1] < 0.05:
-            d = i
-            break
-    bpq = []
-    for i in ["n","c"]:
+    best = memo.get((key, "orders", tmax, patience))
+    if best is not None :
+        return best
+    d = memo.get((key, "d", tmax))
+    if d is None :
+        d = _diff_order(values, tmax)[0]
+        memo.set((key, "d", tmax), d)
+    pq = memo.get((key, "pq"))
+    if pq is None :
+        # 原实现对 ["n","c"] 循环调用了两次完全相同的搜索，只计算一次结果不变。
         tmp = arma_order_select_ic(tdt, ic=['aic','bic','hqic'])
-        bpq.extend([
-            tmp["aic_min_order"],
-            tmp["bic_min_order"],
-            tmp["hqic_min_order"],
-        ])
-    p = np.argmax(np.bincount(np.array(bpq).T[0]))
-    q = np.argmax(np.bincount(np.array(bpq).T[1]))
-    x = np.fft.fft(tdt)
-    xf = np.linspace(0.0,0.5,len(tdt)//2)
-    dx = xf[np.argmax(np.abs(x[1:(len(tdt)//2)]))]
-    s = 0 if dx == 0.0 else 1//dx
+        bpq = [tmp["aic_min_order"], tmp["bic_min_order"], tmp["hqic_min_order"]]
+        pq = (int(np.argmax(np.bincount(np.array(bpq).T[0]))),
+              int(np.argmax(np.bincount(np.array(bpq).T[1]))))
+        memo.set((key, "pq"), pq)
+    p, q = pq
+    s = int(_seasonal_periods(values[None, :])[0])
     if s == 0 :
-        bP,bD,bQ = (0,0,0)
+        candidates = [(0,0,0,0)]
     else:
-        Pl = list(range(0,p+1))
-        bD = 1
-        Ql = list(range(0,q+1))
-        lPDQl = list(product(Pl,[bD],Ql,[s]))
-        PDQtrend = product(lPDQl,['n',"c",'t','ct'])
-        aic_min = 100000
-        for ix in PDQtrend:
-            model = SARIMAX(tdt,order=(p,d,d),
-                            seasonal_order=ix[0],
-                            trend=ix[1]).fit(disp=False)
-            aic = model.aic
-            if aic < aic_min:
-                aic_min = aic
-                bP,bD,bQ,_ = ix[0]
-                bT = ix[1]
-    return ((p,d,q),(bP,bD,bQ,int(s)),bT)
+        # 按复杂度 P+Q 从低到高排列，便于提前结束。
+        candidates = sorted(product(range(0,p+1),[1],range(0,q+1),[s]),
+                            key=lambda x: x[0]+x[2])
+    grid = [(sx, tx) for sx in candidates for tx in ['n',"c",'t','ct']]
+    order = (p,d,q)
+    # 同一复杂度 P+Q 的候选为一层，是否提前结束只在层与层之间判断，
+    # 结果只取决于候选顺序和 patience ，与进程数、缓存命中情况无关。
+    levels = {}
+    for sx,tx in grid:
+        levels.setdefault(sx[0]+sx[2], []).append((sx,tx))
+    aics = {}
+    executor = None
+    try :
+        aic_min = float("inf")
+        stale = 0
+        for level in levels.values():
+            todo = []
+            for sx,tx in level:
+                res = memo.get((key, order, sx, tx))
+                if res is None :
+                    todo.append((sx,tx))
+                else :
+                    aics[(sx,tx)] = res
+            tasks = [(values, order, sx, tx) for sx,tx in todo]
+            if n_workers == 1 or len(tasks) < 2 :
+                res = [_sarimax_aic(x) for x in tasks]
+            else :
+                if executor is None :
+                    executor = _process_pool(n_workers)
+                res = list(executor.map(_sarimax_aic, tasks))
+            for ix, aic in zip(todo, res):
+                aics[ix] = aic
+                memo.set((key, order, ix[0], ix[1]), aic)
+            level_min = min(aics[x] for x in level)
+            if level_min < aic_min :
+                aic_min = level_min
+                stale = 0
+            else :
+                stale += 1
+                if patience is not None and stale >= patience :
+                    break
+    finally :
+        if executor is not None :
+            executor.shutdown(cancel_futures=True)
+    # 按候选顺序取AIC最小者，AIC相同时结果也是确定的。
+    bS, bT = min((x for x in grid if x in aics), key=aics.get)
+    bP,bD,bQ,_ = bS
+    best = (order,(bP,bD,bQ,int(s)),bT)
+    memo.set((key, "orders", tmax, patience), best)
+    return best
+
+def _write_json(target:Path, rec:dict) -> None:
+    """原子写入JSON：每次使用唯一的临时文件，多个线程、进程同时写同一条缓存也不会冲突。"""
+    with NamedTemporaryFile("w", encoding="utf-8", dir=target.parent, prefix=target.name,
+                            suffix=".tmp", delete=False) as f:
+        json.dump(rec, f, ensure_ascii=False)
+    try :
+        os.replace(f.name, target)
+    finally :
+        Path(f.name).unlink(missing_ok=True)
+
+class _jsonStore(object):
+    """
+    每条记录一个JSON文件的磁盘存储，按最近使用时间（文件修改时间）淘汰。
+    子类给出 SUFFIX 与 entry() 的键规则。
+    """
+    SUFFIX = ".json"
+    def __init__(self, cache_dir:str|Path, ttl:float|None = 7 * 86400,
+                 max_entries:int = 10000) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.warm_starts = 0
+    def __repr__(self) -> str:
+        return "{}({}, size={}/{}, hits={}, misses={}, warm_starts={})".format(
+            type(self).__name__, self.cache_dir, len(self), self.max_entries, 
+            self.hits, self.misses, self.warm_starts)
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob("*"+self.SUFFIX))
+    def _path(self, key:str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir/"{}{}".format(digest, self.SUFFIX)
+    @staticmethod
+    def _load(target:Path) -> dict|None:
+        try :
+            with open(target, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) :
+            return None
+    def _expired(self, rec:dict) -> bool:
+        return self.ttl is not None and time.time() - rec["created"] > self.ttl
+    def evict(self, max_entries:int|None = None) -> None:
+        """按最近使用时间淘汰缓存，直到数量不超过 max_entries 。"""
+        limit = self.max_entries if max_entries is None else max_entries
+        files = sorted(self.cache_dir.glob("*"+self.SUFFIX), key=lambda x: x.stat().st_mtime)
+        for xfile in files[:max(len(files) - limit, 0)]:
+            xfile.unlink(missing_ok=True)
+    def clear(self) -> None:
+        self.evict(max_entries=0)
+        self.hits = 0
+        self.misses = 0
+        self.warm_starts = 0
+
+class orderCache(_jsonStore):
+    """
+    quickOrders(pm.auto_arima) 选出的模型参数的磁盘缓存。
+    每条序列（series_id, m, 搜索参数）保存一个JSON文件，记录最近一次的数据指纹与模型参数：
+      - 数据指纹相同且未过期时直接返回，不再搜索；
+      - 数据有更新（如每天增加几个点）时，从上一次选出的参数开始逐步搜索（warm start）。
+    cache_dir - 缓存文件夹。
+    ttl - 有效期（秒），过期后重新搜索，默认7天，None表示不过期。
+    max_entries - 最多保存的序列数，超出后按最近使用时间淘汰。
+    命中只更新最近使用时间（用于淘汰），有效期始终从搜索出参数的时间算起，不会因命中而延长。
+    """
+    SUFFIX = ".order.json"
+    def entry(self, series_id:str, m:int, **kwargs) -> Path:
+        """返回缓存文件路径。"""
+        return self._path(repr((str(series_id), m, sorted((k, repr(v)) for k,v in kwargs.items()))))
+    def read(self, series_id:str, m:int, **kwargs) -> dict|None:
+        """读取缓存记录，不存在或损坏时返回None。"""
+        return self._load(self.entry(series_id, m, **kwargs))
+    def lookup(self, series_id:str, m:int, fingerprint:str, **kwargs) -> tuple[tuple|None, dict|None]:
+        """
+        返回 (命中的模型参数, 缓存记录)。
+        未命中时第一个值为None，第二个值为可用于warm start的旧记录（可能为None）。
+        """
+        rec = self.read(series_id, m, **kwargs)
+        fresh = rec is not None and not self._expired(rec)
+        if fresh and rec["fingerprint"] == fingerprint :
+            self.hits += 1
+            os.utime(self.entry(series_id, m, **kwargs))
+            return (tuple(rec["order"]), tuple(rec["seasonal_order"]), rec["trend"]), rec
+        self.misses += 1
+        return None, rec
+    def store(self, series_id:str, m:int, fingerprint:str, orders:tuple, **kwargs) -> None:
+        order, seasonal_order, trend = orders
+        rec = {"series_id": str(series_id), "m": m, "fingerprint": fingerprint,
+               "order": [int(x) for x in order],
+               "seasonal_order": [int(x) for x in seasonal_order],
+               "trend": trend, "created": time.time()}
+        target = self.entry(series_id, m, **kwargs)
+        _write_json(target, rec)
+        self.evict()
+    def invalidate(self, series_id:str, m:int, **kwargs) -> None:
+        self.entry(series_id, m, **kwargs).unlink(missing_ok=True)
+
+ORDER_CACHE = None
+
+def set_order_cache(cache_dir:str|Path|None, ttl:float|None = 7 * 86400,
+                    max_entries:int = 10000) -> orderCache|None:
+    """
+    设置 quickOrders/quickARIMA 默认使用的模型参数缓存，cache_dir 为None时关闭。
+    """
+    global ORDER_CACHE
+    ORDER_CACHE = None if cache_dir is None else orderCache(cache_dir, ttl, max_entries)
+    return ORDER_CACHE
+
+def _get_order_cache(order_cache:orderCache|bool|None) -> orderCache|None:
+    if order_cache is None or order_cache is True :
+        return ORDER_CACHE
+    return None if order_cache is False else order_cache
+
+class modelStore(_jsonStore):
+    """
+    quickARIMA 拟合结果（SARIMAX参数）的磁盘存储。
+    每条序列（series_id, 模型参数, 外生变量）保存一个JSON文件，记录拟合时的观测数、历史数据指纹与参数估计值。
+    再次预测时，如果新数据只是在原历史后追加了观测：
+      - 未过期：直接用已有参数做卡尔曼滤波（相当于 results.append(refit=False)），
+        成本只与数据长度线性相关，不再做最大似然优化；
+      - 已过期或 refit=True：以已有参数作为 start_params 重新估计，通常只需要很少的迭代。
+    历史数据被修改、模型结构变化时重新完整拟合。
+    cache_dir - 存储文件夹。
+    ttl - 参数有效期（秒），过期后以warm start方式重新估计，默认7天，None表示不过期。
+    max_entries - 最多保存的模型数，超出后按最近使用时间淘汰。
+    命中只更新最近使用时间（用于淘汰），有效期始终从参数估计的时间算起，
+    过期后的warm start会重新估计并写入新的记录。
+    """
+    SUFFIX = ".sarimax.json"
+    def entry(self, series_id:str, orders:tuple, exog:list[str]|None = None) -> Path:
+        """返回存储文件路径。"""
+        return self._path(repr((str(series_id), repr(orders), repr(exog))))
+    def read(self, series_id:str, orders:tuple, exog:list[str]|None = None) -> dict|None:
+        """读取存储记录，不存在或损坏时返回None。"""
+        return self._load(self.entry(series_id, orders, exog))
+    def lookup(self, series_id:str, orders:tuple, exog:list[str]|None,
+               values:np.ndarray, param_names:list[str],
+               refit:bool = False) -> tuple[np.ndarray|None, bool]:
+        """
+        返回 (参数, 是否需要重新估计)。参数为None时需要完整拟合。
+        """
+        rec = self.read(series_id, orders, exog)
+        if (rec is None or rec["param_names"] != param_names or rec["nobs"] > len(values) or 
+            rec["fingerprint"] != _fingerprint(values[:rec["nobs"]])) :
+            self.misses += 1
+            return None, True
+        params = np.asarray(rec["params"], dtype=np.float64)
+        if refit or self._expired(rec) :
+            self.warm_starts += 1
+            return params, True
+        self.hits += 1
+        os.utime(self.entry(series_id, orders, exog))
+        return params, False
+    def store(self, series_id:str, orders:tuple, exog:list[str]|None,
+              values:np.ndarray, param_names:list[str], params:np.ndarray) -> None:
+        rec = {"series_id": str(series_id), "nobs": len(values),
+               "fingerprint": _fingerprint(values),
+               "param_names": list(param_names),
+               "params": [float(x) for x in params], "created": time.time()}
+        target = self.entry(series_id, orders, exog)
+        _write_json(target, rec)
+        self.evict()
+    def invalidate(self, series_id:str, orders:tuple, exog:list[str]|None = None) -> None:
+        self.entry(series_id, orders, exog).unlink(missing_ok=True)
+
+MODEL_STORE = None
+
+def set_model_store(cache_dir:str|Path|None, ttl:float|None = 7 * 86400,
+                    max_entries:int = 10000) -> modelStore|None:
+    """
+    设置 quickARIMA 默认使用的模型存储，cache_dir 为None时关闭。
+    """
+    global MODEL_STORE
+    MODEL_STORE = None if cache_dir is None else modelStore(cache_dir, ttl, max_entries)
+    return MODEL_STORE
+
+def _get_model_store(model_store:modelStore|bool|None) -> modelStore|None:
+    if model_store is None or model_store is True :
+        return MODEL_STORE
+    return None if model_store is False else model_store
+
+def _warm_start(alargs:dict, rec:dict) -> dict:
+    """用上一次选出的参数作为逐步搜索的起点，用户显式给出的起点优先。"""
+    p, _, q = rec["order"]
+    P, _, Q, _ = rec["seasonal_order"]
+    for name, value, upper in [("p", p, 5), ("q", q, 5), ("P", P, 2), ("Q", Q, 2)]:
+        alargs.setdefault("start_"+name, value)
+        alargs["max_"+name] = max(alargs.get("max_"+name, upper), alargs["start_"+name])
+    return alargs
 
 def quickOrders(data:pl.DataFrame|pd.DataFrame, target:str, 
-                m:int = 1, **kwargs) -> tuple:
+                m:int = 1, series_id:str|None = None,
+                order_cache:orderCache|bool|None = None, **kwargs) -> tuple:
     """
     快速选择ARIMA模型的参数
     m - 季节性周期：
@@ -112,6 +551,9 @@ def quickOrders(data:pl.DataFrame|pd.DataFrame, target:str,
         7 - daily
         12 - monthly
         52 - weekly
+    series_id - 序列标识，用于模型参数缓存。同一序列数据更新后会从上次的参数开始搜索；
+                为None时只有数据完全相同才会命中缓存。
+    order_cache - 模型参数缓存，None/True使用 set_order_cache 设置的默认缓存，False不使用缓存。
     kwargs - arima模型的额外参数，可使用 `help_kwargs("AutoARIMA")` 查看所有参数。
     返回：
     order - ARIMA模型的参数（p,d,q）
@@ -122,9 +564,18 @@ def quickOrders(data:pl.DataFrame|pd.DataFrame, target:str,
     if target not in data.columns:
         raise ValueError(f"Column {target} not found in DataFrame.")
     if isinstance(data, pl.DataFrame) :
-        tardata = data.to_pandas()[target]
+        # 只转换需要的列；模型需要NumPy内存，不使用Arrow扩展类型。
+        tardata = data.get_column(target).to_pandas()
     else :
         tardata = data[target]
+    cache = _get_order_cache(order_cache)
+    rec = None
+    if cache is not None :
+        fingerprint = _fingerprint(tardata.to_numpy())
+        series_id = fingerprint if series_id is None else series_id
+        res, rec = cache.lookup(series_id, m, fingerprint, **kwargs)
+        if res is not None :
+            return res
     alargs = {
         "seasonal":True,
         "m":m,
@@ -132,9 +583,16 @@ def quickOrders(data:pl.DataFrame|pd.DataFrame, target:str,
         "trace":True,
         "error_action":"ignore",
         "suppress_warnings":True
-    }.update(kwargs)
+    }
+    alargs.update(kwargs)
+    if rec is not None and alargs["stepwise"] :
+        alargs = _warm_start(alargs, rec)
+        cache.warm_starts += 1
     model = pm.auto_arima(tardata,**alargs)
-    return model.order, model.seasonal_order, model.trend
+    res = (model.order, model.seasonal_order, model.trend)
+    if cache is not None :
+        cache.store(series_id, m, fingerprint, res, **kwargs)
+    return res
 
 def help_kwargs(funcnama:str, println:bool = True) -> str|None :
     """参数帮助文档"""
@@ -161,11 +619,42 @@ def help_kwargs(funcnama:str, println:bool = True) -> str|None :
     else :
         return txt
 
+def prophet_init(model:Prophet) -> dict:
+    """
+    取出已拟合Prophet模型的参数，作为下一次拟合的初始值（warm start），可被pickle传给子进程。
+    模型结构（changepoints数量、季节项、外生变量）需要与下一次拟合相同。
+    """
+    res = {}
+    for pname in ["k", "m", "sigma_obs"]:
+        res[pname] = float(model.params[pname][0][0])
+    for pname in ["delta", "beta"]:
+        res[pname] = np.asarray(model.params[pname][0])
+    return res
+
+@contextmanager
+def _quiet_stan(quiet:bool = True):
+    """临时关闭cmdstanpy/prophet的INFO日志，短序列拟合时日志输出往往比拟合本身更慢。"""
+    # cmdstanpy第一次使用时才配置日志级别，这里使用 disabled 而不是修改级别。
+    loggers = [logging.getLogger(x) for x in ["cmdstanpy", "prophet"]] if quiet else []
+    states = [x.disabled for x in loggers]
+    for x in loggers:
+        x.disabled = True
+    try :
+        yield
+    finally :
+        for x, state in zip(loggers, states):
+            x.disabled = state
+
 def quickProphet(data: pl.DataFrame|pd.DataFrame, 
                  dt: str, y: str, 
                  exog: list[str]|None = None,
                  n_periods: int = 10, 
-                 future_exog:pl.DataFrame|pd.DataFrame|None = None, **kwargs) -> szDataFrame:
+                 future_exog:pl.DataFrame|pd.DataFrame|None = None,
+                 freq: str|None = None,
+                 fit_kwargs: dict|None = None,
+                 init: dict|Prophet|None = None,
+                 quiet: bool = False,
+                 return_model: bool = False, **kwargs) -> szDataFrame|tuple[szDataFrame, Prophet]:
     """
     使用Prophet库进行时间序列预测的快速函数。
 
@@ -175,52 +664,87 @@ def quickProphet(data: pl.DataFrame|pd.DataFrame,
         y (str): 目标列在输入数据框中的列名。
         exog (list[str]): 额外的外生变量列名列表。
         n_periods (int): 需要预测的未来时间周期数量。
-        future_exog (pl.DataFrame): 未来时间点的外生变量数据框。
+        future_exog (pl.DataFrame): 未来时间点的外生变量数据框，行数为 n_periods 。
+        freq (str): 时间频率，已知时给出可以跳过频率推断。
+        fit_kwargs (dict): 传给Stan优化器的参数，如 {"algorithm": "LBFGS", "iter": 1000} 或 {"algorithm": "Newton"} 。
+        init (dict|Prophet): 拟合的初始值（warm start），可以是上一次拟合的模型或 prophet_init 的结果。
+        quiet (bool): 关闭cmdstanpy/prophet的INFO日志。
+        return_model (bool): 同时返回拟合好的Prophet模型。
         **kwargs: Prophet模型的额外参数。可使用 `help_kwargs("Prophet")` 查看所有参数。
 
     返回:
-        pl.DataFrame: 包含原始数据和预测结果的Polars DataFrame。
+        szDataFrame: 包含原始数据和预测结果的数据框；return_model 为True时返回 (数据框, 模型) 。
     """
     # 参数检查
     if not is_DataFrame(data):
         raise ValueError("Input data must be a polars/pandas DataFrame.")
+    if isinstance(data, tsFrame) :
+        # tsFrame 已在创建时推断过频率。
+        freq = data.getFreq() if freq is None else freq
+        data = data.to_polars()
     if dt not in data.columns or y not in data.columns:
         raise ValueError(f"Columns {dt} or {y} not found in DataFrame.")
-    if exog is not None :
+    exog = exog if exog else []
+    if exog :
         if not set(exog).issubset(data.columns) :
             raise ValueError("exog columns not found in DataFrame.")
         if future_exog is None :
             raise ValueError("futuree_exog must be provided when exog is not None.")
-    # 创建Prophet所需的DataFrame格式
-    if isinstance(data, pl.DataFrame) :
-        df = data.select(pl.col(dt), pl.col(y)).rename({dt: "ds", y: "y"})
-        df = df.to_pandas()
-    else :
-        df = data[[dt, y]].rename({dt: "ds", y: "y"})
-    # 计算时间间隔
-    freq = pd.infer_freq(df["ds"])
+        if len(future_exog) != n_periods :
+            raise ValueError(f"future_exog must have exactly {n_periods} rows.")
+    if isinstance(data, pd.DataFrame) :
+        data = pl.from_pandas(data)
+    # 创建Prophet所需的DataFrame格式，只转换需要的列，且只转换一次。
+    df = data.select(pl.col(dt).alias("ds"), pl.col(y).alias("y"), *exog).to_pandas()
+    if freq is None :
+        freq = pd.infer_freq(df["ds"])
+    if isinstance(init, Prophet) :
+        init = prophet_init(init)
+    fit_kwargs = dict(fit_kwargs) if fit_kwargs else {}
+    if init is not None :
+        fit_kwargs["init"] = init
     # 初始化Prophet模型
     model = Prophet(**kwargs)
     for col in exog :
         model.add_regressor(col)
-    model.fit(df)
-    # 生成未来的时间点
-    future = model.make_future_dataframe(periods=n_periods, freq=freq)
-    if exog is not None :
+    with _quiet_stan(quiet):
+        model.fit(df, **fit_kwargs)
+    # 生成未来的时间点：历史部分直接使用拟合数据（含外生变量），未来部分使用 future_exog 。
+    future = model.make_future_dataframe(periods=n_periods, freq=freq, include_history=False)
+    if exog :
+        if isinstance(future_exog, pl.DataFrame) :
+            future_exog = future_exog.select(exog).to_pandas()
         for col in exog :
-            future[col] = future_exog[col]
+            future[col] = np.asarray(future_exog[col])
+    history = df.loc[df["y"].notna(), ["ds"] + exog].sort_values("ds")
     # 预测
-    forecast = model.predict(future)
-    # 转换为Polars DataFrame并合并
-    forecast_pl = pl.from_pandas(forecast)
-    result = data.join(forecast_pl.rename({"ds": dt}), on=dt, how="outer")
-    return szDataFrame(filepath=None, from_data=result)
+    forecast = model.predict(pd.concat([history, future], ignore_index=True))
+    # 转换为Polars后，在原数据后追加未来的时间点，再按时间左连接预测结果。
+    forecast_pl = pl.from_pandas(forecast).rename({"ds": dt}).with_columns(
+        pl.col(dt).cast(data.schema[dt]))
+    news = forecast_pl.select(dt).filter(pl.col(dt) > data[dt].max())
+    result = pl.concat([data, news], how="diagonal").join(forecast_pl, on=dt, how="left")
+    result = szDataFrame(filepath=None, from_data=result)
+    return (result, model) if return_model else result
 
 def quickARIMA(data: Union[pl.DataFrame, pd.DataFrame], target: str, 
                n_periods: int = 10,
                exog: Union[list[str], None] = None, m: int = 1,
                future_exog: Union[pl.DataFrame, pd.DataFrame, None] = None,
-               orders: Union[tuple, str] = "auto", **kwargs) -> pl.DataFrame:
+               orders: Union[tuple, str] = "auto",
+               series_id: Union[str, None] = None,
+               order_cache: Union[orderCache, bool, None] = None,
+               model_store: Union[modelStore, bool, None] = None,
+               refit: bool = False, **kwargs) -> pl.DataFrame:
+    """
+    使用SARIMAX进行时间序列预测的快速函数。
+    orders - ((p,d,q),(P,D,Q,s),trend)，或"auto"使用 quickOrders 自动选择。
+    series_id - 序列标识，用于模型参数缓存与模型存储。
+    model_store - 模型存储，None/True使用 set_model_store 设置的默认存储，False不使用。
+                  需要同时给出 series_id ，新数据只是追加观测时复用已有参数，不再做完整的最大似然估计。
+    refit - 为True时以已有参数为起点重新估计参数。
+    返回：{target}_pred、{target}_upper、{target}_lower 三列的 pl.DataFrame 。
+    """
     # 输入校验
     if not is_DataFrame(data):
         raise ValueError("Input data must be a polars/pandas DataFrame.")
@@ -231,16 +755,18 @@ def quickARIMA(data: Union[pl.DataFrame, pd.DataFrame], target: str,
     if isinstance(orders, str):
         if orders.lower() == "auto":
             # 假设quickOrders返回(order, seasonal_order, trend)
-            orders = quickOrders(data, target, m=m, **kwargs)
+            orders = quickOrders(data, target, m=m, series_id=series_id,
+                                 order_cache=order_cache, **kwargs)
         else:
             raise ValueError("orders must be a tuple or 'auto'.")
     elif not (isinstance(orders, tuple) and len(orders) == 3):
         raise ValueError("orders must be a tuple((p,d,q),(P,D,Q,s),trend) or 'auto'.")
     # 统一转换为pandas格式处理
+    # 只转换需要的列；pandas数据只读取，不需要复制。
     if isinstance(data, pl.DataFrame):
-        data_pd = data.to_pandas()
+        data_pd = data.select([target] + (exog if exog else [])).to_pandas()
     else:
-        data_pd = data.copy()
+        data_pd = data
     # 提取目标变量和外生变量
     endog = data_pd[target]
     exog_data = data_pd[exog] if exog is not None else None
@@ -255,7 +781,20 @@ def quickARIMA(data: Union[pl.DataFrame, pd.DataFrame], target: str,
         trend=trend,
         **kwargs
     )
-    model_fit = model.fit(disp=False)
+    store = _get_model_store(model_store) if series_id is not None else None
+    params, estimate = None, True
+    if store is not None :
+        values = endog.to_numpy(dtype=np.float64)
+        params, estimate = store.lookup(series_id, orders, exog, values,
+                                        model.param_names, refit=refit)
+    if params is None :
+        model_fit = model.fit(disp=False)
+    elif estimate :
+        model_fit = model.fit(start_params=params, disp=False)
+    else :
+        model_fit = model.filter(params)
+    if store is not None and estimate :
+        store.store(series_id, orders, exog, values, model.param_names, model_fit.params)
     # 预测阶段的外生变量处理
     future_exog_processed = None
     if exog is not None:
@@ -286,6 +825,119 @@ def quickARIMA(data: Union[pl.DataFrame, pd.DataFrame], target: str,
         f"{target}_lower": conf_int.iloc[:, 0].values
     })
 
+def _future_dates(dates:pl.Series, n_periods:int) -> pl.Series:
+    """根据历史日期的频率生成未来日期，无法推断频率时返回空值。"""
+    freq = pd.infer_freq(dates.to_pandas()) if len(dates) >= 3 else None
+    if freq is None :
+        return pl.Series(dates.name, [None]*n_periods, dtype=dates.dtype)
+    res = pd.date_range(start=dates.max(), periods=n_periods+1, freq=freq)[1:]
+    return pl.Series(dates.name, res).cast(dates.dtype)
+
+def _arima_task(data:pl.DataFrame, dt:str, y:str, n_periods:int,
+                exog:list[str]|None = None, future_exog:pl.DataFrame|None = None,
+                **kwargs) -> pl.DataFrame:
+    res = quickARIMA(data, y, n_periods=n_periods, exog=exog,
+                     future_exog=future_exog, **kwargs)
+    return res.with_columns(_future_dates(data[dt], n_periods)).select(dt, pl.all().exclude(dt))
+
+def _prophet_task(data:pl.DataFrame, dt:str, y:str, n_periods:int,
+                  exog:list[str]|None = None, future_exog:pl.DataFrame|None = None,
+                  **kwargs) -> pl.DataFrame:
+    # 批量拟合时默认关闭Stan日志。
+    kwargs.setdefault("quiet", True)
+    res = quickProphet(data, dt, y, exog=exog, n_periods=n_periods,
+                       future_exog=future_exog, **kwargs).get()
+    return res.filter(pl.col(dt) > data[dt].max()).select(
+        pl.col(dt),
+        pl.col("yhat").alias(f"{y}_pred"),
+        pl.col("yhat_upper").alias(f"{y}_upper"),
+        pl.col("yhat_lower").alias(f"{y}_lower"))
+
+FORECASTERS = {
+    "arima": _arima_task,
+    "prophet": _prophet_task,
+}
+
+def _forecast_series(task:tuple) -> pl.DataFrame:
+    """单条序列的预测任务，在子进程中执行。失败时返回一行记录错误信息。"""
+    sid, data, model, id_col, dt, y, n_periods, exog, future_exog, kwargs = task
+    try :
+        func = FORECASTERS[model] if isinstance(model, str) else model
+        kwargs = dict(kwargs)
+        namespace = kwargs.pop("namespace", None)
+        if model == "arima" and namespace is not None :
+            # 序列标识用于模型参数缓存与模型存储，加上命名空间，不同数据集的同名序列互不影响。
+            kwargs = {"series_id": "{}/{}".format(namespace, sid), **kwargs}
+        res = func(data, dt, y, n_periods, exog, future_exog, **kwargs)
+        res = res.with_columns(pl.lit(sid).alias(id_col),
+                               pl.lit("ok").alias("status"),
+                               pl.lit(None, dtype=pl.Utf8).alias("error"))
+    except Exception as e :
+        res = pl.DataFrame({id_col: [sid], "status": ["failed"],
+                            "error": ["{}: {}".format(type(e).__name__, e)]})
+    return res
+
+def _run_tasks(tasks:list[tuple], n_workers:int|None = None, 
+               chunksize:int = 1) -> list[pl.DataFrame]:
+    """执行 _forecast_series 任务，n_workers 为1时在当前进程中顺序执行。"""
+    if n_workers == 1 :
+        return [_forecast_series(x) for x in tasks]
+    with _process_pool(n_workers) as executor:
+        return list(executor.map(_forecast_series, tasks, chunksize=chunksize))
+
+def forecast_many(data:pl.DataFrame|pd.DataFrame, id_col:str, dt:str, y:str,
+                  model:str|Callable = "arima", n_periods:int = 10,
+                  exog:list[str]|None = None,
+                  future_exog:pl.DataFrame|pd.DataFrame|None = None,
+                  n_workers:int|None = None, chunksize:int = 1,
+                  namespace:str|None = None, **kwargs) -> pl.DataFrame:
+    """
+    多序列批量预测。
+    把长格式数据按 id_col 拆分为多条序列，在进程池中分别拟合预测，最后合并为一个结果表。
+
+    参数:
+        data: 长格式数据，包含 id_col、dt、y（以及 exog）列。
+        id_col: 序列标识列。
+        dt: 时间列。
+        y: 目标列。
+        model: "arima"（quickARIMA）、"prophet"（quickProphet），
+               或可被pickle的函数 func(data, dt, y, n_periods, exog, future_exog, **kwargs) -> pl.DataFrame 。
+        n_periods: 预测期数。
+        exog: 外生变量列名。
+        future_exog: 未来外生变量，长格式，需包含 id_col 。
+        n_workers: 进程数，默认为CPU核数；为1时在当前进程中顺序执行。
+        chunksize: 每次发送给子进程的序列数量，序列很多且很短时调大可以减少进程间通信开销。
+        namespace: 仅用于 "arima" 。给出时以 "{namespace}/{id}" 作为 series_id ，
+                   使用模型参数缓存的增量搜索与模型存储（同一数据集每次运行使用相同的 namespace）；
+                   默认None时参数缓存按每条序列的数据指纹区分，不使用模型存储。
+        **kwargs: 传给模型函数的其他参数（如 orders、m 或Prophet参数）。
+
+    返回:
+        pl.DataFrame: id_col、dt、{y}_pred、{y}_upper、{y}_lower、status、error 。
+        某条序列失败时不会中断，只返回一行 status="failed" 并在 error 中记录原因。
+
+    注意：Windows上使用进程池时，调用代码需要放在 `if __name__ == "__main__":` 中。
+    """
+    if isinstance(model, str) and model not in FORECASTERS :
+        raise ValueError("model must be one of {} or a callable.".format(list(FORECASTERS.keys())))
+    if isinstance(data, pd.DataFrame) :
+        data = pl.from_pandas(data)
+    if isinstance(future_exog, pd.DataFrame) :
+        future_exog = pl.from_pandas(future_exog)
+    usecols = [id_col, dt, y] + (exog if exog else [])
+    if not set(usecols).issubset(data.columns) :
+        raise ValueError("Columns {} not found in DataFrame.".format(
+            [x for x in usecols if x not in data.columns]))
+    groups = data.select(usecols).sort(id_col, dt).partition_by(
+        id_col, as_dict=True, maintain_order=True)
+    fexogs = {} if future_exog is None else future_exog.partition_by(id_col, as_dict=True)
+    if namespace is not None :
+        kwargs["namespace"] = namespace
+    tasks = [(key[0], group, model, id_col, dt, y, n_periods, exog, 
+              fexogs.get(key), kwargs) for key, group in groups.items()]
+    res = pl.concat(_run_tasks(tasks, n_workers, chunksize), how="diagonal_relaxed")
+    return res.select(id_col, pl.all().exclude(id_col))
+
 def quickPreRNN(data:pl.DataFrame|pd.DataFrame, target:str,
                 engine:str = "autogluon", module:str = "bolt_base") -> pl.DataFrame :
     """
@@ -20,29 +20,120 @@ import polars as pl
 from zipfile import ZipFile
 from os import stat_result
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Self
+from io import BytesIO
+from tempfile import SpooledTemporaryFile, NamedTemporaryFile
+from typing import IO, Self
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
 from rich import print
+
+import os
+import mmap
+import shutil
+import hashlib
+from glob import glob
 from typing import List, Union
 
-from pmdarima.model_selection import train_test_split
+__all__ = ["getreader","getscanner","read_tsv","scan_tsv","checkExpr",
+           "dataframeColumns","just_load","szDataFrame","zipreader",
+           "archiveCache","ARCHIVE_CACHE","zipColumns",
+           "schemaRegistry","SCHEMA_REGISTRY","probe_schema","fileIdentity",
+           "load_many","frameCache","set_frame_cache",
+           "to_pandas","set_pandas_arrow","use_pandas_arrow"]
+
+SCANNERS = {
+    ".csv": "scan_csv",
+    ".txt": "scan_csv",
+    ".parquet": "scan_parquet",
+    ".ipc": "scan_ipc",
+    ".arrow": "scan_ipc",
+    ".feather": "scan_ipc",
+    ".ndjson": "scan_ndjson",
+    ".jsonl": "scan_ndjson",
+}
+
+PANDAS_ARROW = False
+
+def set_pandas_arrow(enable:bool = True) -> None:
+    """
+    设置转换为pandas时的默认方式。
+    为True时使用Arrow扩展类型（use_pyarrow_extension_array），数据不再复制为NumPy内存。
+    """
+    global PANDAS_ARROW
+    PANDAS_ARROW = enable
+
+def use_pandas_arrow(arrow:bool|None = None) -> bool:
+    """arrow为None时返回 set_pandas_arrow 的默认设置。"""
+    return PANDAS_ARROW if arrow is None else arrow
 
-__all__ = ["getreader","read_tsv","checkExpr","dataframeColumns",
-           "just_load","szDataFrame","zipreader"]
+def to_pandas(data:pl.DataFrame, arrow:bool|None = None, **kwgs) -> pd.DataFrame:
+    """pl.DataFrame 转换为 pd.DataFrame ，arrow为None时使用 set_pandas_arrow 的默认设置。"""
+    return data.to_pandas(use_pyarrow_extension_array=use_pandas_arrow(arrow), **kwgs)
 
-def read_tsv(filepath:Path, **kwgs) -> pl.DataFrame:
-    with open(filepath, 'r', encoding="utf-8") as file:
-        first_line = file.readline()
-    lenCols = len(first_line.split("\t"))
+def _head_bytes(stream:IO[bytes], chunk:int = 2**16) -> BytesIO:
+    # 读取到第一个换行符为止（至少一个块），只用于解析表头。
+    head = stream.read(chunk)
+    while head and b"\n" not in head :
+        more = stream.read(chunk)
+        if not more :
+            break
+        head += more
+    return BytesIO(head[:head.find(b"\n")+1] if b"\n" in head else head)
+
+def _tsv_width(filepath:Path|IO[bytes], separator:str = "\t") -> int:
+    # 只读取第一行（按块读取，不会整行读入超长文件）来确定列数。
+    if hasattr(filepath, "read") :
+        head = _head_bytes(filepath).getvalue()
+        filepath.seek(0)
+    else :
+        with open(filepath, "rb") as file:
+            head = _head_bytes(file).getvalue()
+    return head.rstrip(b"\r\n").count(separator.encode("utf-8")) + 1
+
+def _tsv_kwargs(filepath:Path|IO[bytes], infer_schema:bool,
+                schema:Mapping[str, pl.DataType]|None, **kwgs) -> dict:
     akwgs = {
         "separator":"\t",
         "quote_char":None,
-        "schema_overrides":[pl.Utf8]*lenCols,
     }
+    if schema is not None :
+        akwgs["schema_overrides"] = schema
+    elif not infer_schema :
+        akwgs["schema_overrides"] = [pl.Utf8]*_tsv_width(filepath)
     akwgs.update(kwgs)
+    return akwgs
+
+def read_tsv(filepath:Path|IO[bytes], infer_schema:bool = False,
+             schema:Mapping[str, pl.DataType]|None = None,
+             memory_map:bool = False, **kwgs) -> pl.DataFrame:
+    """
+    读取tsv文件。
+    默认所有列都读取为字符串（与旧版本一致）。
+    infer_schema - 为True时由Polars推断各列类型，避免之后再逐列转换。
+    schema - 指定部分或全部列的类型（schema_overrides），优先于 infer_schema 。
+    memory_map - 使用内存映射读取本地文件。
+    """
+    akwgs = _tsv_kwargs(filepath, infer_schema, schema, **kwgs)
+    if memory_map and not hasattr(filepath, "read") and Path(filepath).stat().st_size > 0 :
+        with open(filepath, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mfile:
+                return pl.read_csv(mfile, **akwgs)
     return pl.read_csv(filepath, **akwgs)
 
+def scan_tsv(filepath:Path, infer_schema:bool = False,
+             schema:Mapping[str, pl.DataType]|None = None,
+             **kwgs) -> pl.LazyFrame:
+    """read_tsv 的惰性版本，返回 pl.LazyFrame 。"""
+    return pl.scan_csv(filepath, **_tsv_kwargs(filepath, infer_schema, schema, **kwgs))
+
 def getreader(dirfile:Path|str, used_by:str|None = None):
+    """
+    按扩展名获取读取函数。
+    Path.suffix 只取最后一个扩展名（"a.v1.parquet" 为 ".parquet"，".hidden" 为空），
+    去掉开头的点后查找 pl.read_* ，找不到时使用 pl.read_csv 。
+    """
     if used_by is None :
         fna = Path(dirfile).suffix
         if fna in [".xls",".xlsx"]:
@@ -50,13 +141,131 @@ def getreader(dirfile:Path|str, used_by:str|None = None):
         elif fna == ".tsv":
             return read_tsv
         else:
-            return getattr(pl, "read_{}".format(fna), pl.read_csv)
+            return getattr(pl, "read_{}".format(fna[1:]), pl.read_csv)
     else:
         return getattr(pl, "read_{}".format(used_by))
 
-def dataframeColumns(data:str|Path|pl.DataFrame|pd.DataFrame) -> list[str] :
-    if isinstance(data, (str, Path)) :
-        tcols = getreader(data)(data).columns
+def _excel_scanner(filepath:Path, **kwgs) -> pl.LazyFrame:
+    # Excel 没有扫描接口，只能先读取再转为惰性计算。
+    return pl.read_excel(filepath, **kwgs).lazy()
+
+def getscanner(dirfile:Path|str, used_by:str|None = None):
+    """
+    获取惰性读取函数（pl.scan_*），返回 pl.LazyFrame 。
+    不支持扫描的格式（如Excel）会先读入再转换为 LazyFrame 。
+    """
+    if used_by is None :
+        fna = Path(dirfile).suffix.lower()
+        if fna in [".xls",".xlsx"]:
+            return _excel_scanner
+        elif fna == ".tsv":
+            return scan_tsv
+        else:
+            return getattr(pl, SCANNERS.get(fna, "scan_csv"))
+    else:
+        if used_by == "excel":
+            return _excel_scanner
+        return getattr(pl, "scan_{}".format(used_by))
+
+def fileIdentity(filepath:Path|str) -> tuple:
+    """文件标识：(绝对路径, 修改时间, 大小)。文件被修改后标识随之改变。"""
+    path = Path(filepath).absolute()
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+class schemaRegistry(object):
+    """
+    列结构(pl.Schema)的LRU缓存。
+    键的第一个元素必须是 fileIdentity ，文件被修改后旧的列结构自然失效。
+    """
+    def __init__(self, maxsize:int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__schemas = OrderedDict()
+        self.__lock = RLock()
+    def __len__(self) -> int:
+        return len(self.__schemas)
+    def __repr__(self) -> str:
+        return "schemaRegistry(size={}/{}, hits={}, misses={})".format(
+            len(self.__schemas), self.maxsize, self.hits, self.misses)
+    def get(self, key:tuple) -> pl.Schema|None:
+        with self.__lock:
+            res = self.__schemas.get(key)
+            if res is None :
+                self.misses += 1
+            else :
+                self.hits += 1
+                self.__schemas.move_to_end(key)
+            return res
+    def set(self, key:tuple, schema:pl.Schema) -> None:
+        with self.__lock:
+            self.__schemas[key] = schema
+            self.__schemas.move_to_end(key)
+            while len(self.__schemas) > self.maxsize :
+                self.__schemas.popitem(last=False)
+    def invalidate(self, filepath:Path|str) -> None:
+        """移除某个文件的全部列结构。"""
+        path = str(Path(filepath).absolute())
+        with self.__lock:
+            for key in [x for x in self.__schemas if x[0][0] == path]:
+                del self.__schemas[key]
+    def clear(self) -> None:
+        with self.__lock:
+            self.__schemas.clear()
+            self.hits = 0
+            self.misses = 0
+
+SCHEMA_REGISTRY = schemaRegistry()
+
+def _probe_excel(source:Path|IO[bytes], **kwgs) -> pl.Schema:
+    if kwgs.get("engine", "calamine") == "calamine" :
+        read_options = {**(kwgs.pop("read_options", None) or {}), "n_rows": 1}
+        return pl.read_excel(source, read_options=read_options, **kwgs).schema
+    return pl.read_excel(source, **kwgs).schema
+
+def _probe_source(source:Path|IO[bytes], name:str, 
+                  used_by:str|None = None, **kwgs) -> pl.Schema:
+    kind = used_by if used_by else Path(name).suffix.lower()[1:]
+    if kind in ["xls","xlsx","excel"] :
+        return _probe_excel(source, **kwgs)
+    elif kind == "parquet" :
+        return pl.read_parquet_schema(source)
+    elif kind in ["ipc","arrow","feather"] :
+        return pl.Schema(pl.read_ipc_schema(source))
+    elif kind in ["ndjson","jsonl"] :
+        return pl.scan_ndjson(source, **kwgs).collect_schema()
+    elif kind == "json" :
+        return pl.read_json(source, **kwgs).schema
+    else :
+        if not isinstance(source, Path) :
+            source = _head_bytes(source)
+        reader = read_tsv if kind == "tsv" else pl.read_csv
+        return reader(source, **{**kwgs, "n_rows": 0}).schema
+
+def probe_schema(filepath:str|Path, used_by:str|None = None, 
+                 **kwgs) -> pl.Schema:
+    """
+    只读取表头（或文件元数据）获取列结构，不读取数据。
+    1. csv/tsv 使用 n_rows=0
+    2. parquet/ipc 读取文件元数据
+    3. Excel 只读取第一行数据
+    结果以文件标识缓存在 SCHEMA_REGISTRY 中。
+    """
+    key = (fileIdentity(filepath), used_by, repr(sorted(kwgs.items())))
+    res = SCHEMA_REGISTRY.get(key)
+    if res is None :
+        res = _probe_source(Path(filepath), Path(filepath).name, used_by, **kwgs)
+        SCHEMA_REGISTRY.set(key, res)
+    return res
+
+def dataframeColumns(data:str|Path|list[str]|pl.DataFrame|pl.LazyFrame|pd.DataFrame) -> list[str] :
+    if isinstance(data, list) :
+        tcols = data
+    elif isinstance(data, (str, Path)) :
+        tcols = probe_schema(data).names()
+    elif isinstance(data, pl.LazyFrame) :
+        tcols = data.collect_schema().names()
     else :
         tcols = data.columns
     return tcols
@@ -90,7 +299,7 @@ def get_excel_sheets(file_path: Union[str, Path]) -> List[str]:
         return []
 
 def checkExpr(ziel:pl.Expr|list[pl.Expr], 
-              indata:str|Path|pl.DataFrame|pd.DataFrame,
+              indata:str|Path|list[str]|pl.DataFrame|pd.DataFrame,
               by_:str = "all") -> bool :
     tcols = dataframeColumns(indata)
     res = []
@@ -113,10 +322,10 @@ def checkExpr(ziel:pl.Expr|list[pl.Expr],
     return res
 
 def optExpr(ziel:pl.Expr|list[pl.Expr], 
-            indata:str|Path|pl.DataFrame|pd.DataFrame
+            indata:str|Path|list[str]|pl.DataFrame|pd.DataFrame
             ) -> pl.Expr|list[pl.Expr]|None :
-    if checkExpr(ziel, indata, by_="any") :
-        tcols = dataframeColumns(indata)
+    tcols = dataframeColumns(indata)
+    if checkExpr(ziel, tcols, by_="any") :
         res = []
         if isinstance(ziel, list) :
             for xExpr in ziel :
@@ -131,33 +340,240 @@ def optExpr(ziel:pl.Expr|list[pl.Expr],
     else :
         return None
 
+class frameCache(object):
+    """
+    just_load/zipreader 的列式磁盘缓存。
+    首次读取后把数据写成未压缩的 Arrow IPC 文件（sidecar），之后直接内存映射读取。
+    键由文件标识（路径、修改时间、大小）与读取参数共同组成，源文件修改后自动失效。
+    cache_dir - 缓存文件夹。
+    max_bytes - 缓存总大小上限，超出后按最近使用时间淘汰，默认10GB。
+    """
+    SUFFIX = ".arrow"
+    def __init__(self, cache_dir:str|Path, max_bytes:int = 10 * 2**30) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+    def __repr__(self) -> str:
+        return "frameCache({}, size={:.1f}MB/{:.1f}MB, hits={}, misses={})".format(
+            self.cache_dir, self.size()/2**20, self.max_bytes/2**20, self.hits, self.misses)
+    @staticmethod
+    def __digest(txt:str) -> str:
+        return hashlib.sha1(txt.encode("utf-8")).hexdigest()[:16]
+    def __prefix(self, filepath:Path|str, subFile:str|None = None) -> str:
+        return frameCache.__digest(repr((str(Path(filepath).absolute()), subFile)))
+    def sidecar(self, filepath:Path|str, subFile:str|None = None, **kwgs) -> Path:
+        """返回缓存文件路径。"""
+        key = repr((fileIdentity(filepath), subFile, sorted(kwgs.items())))
+        return self.cache_dir/"{}-{}{}".format(self.__prefix(filepath, subFile),
+                                               frameCache.__digest(key), frameCache.SUFFIX)
+    def load(self, filepath:Path|str, reader:callable, subFile:str|None = None, 
+             lazy:bool = False, **kwgs) -> pl.DataFrame|pl.LazyFrame:
+        """
+        读取缓存，未命中时调用 reader() 读取源文件并写入缓存。
+        kwgs - 读取参数，只用于区分缓存键。
+        """
+        target = self.sidecar(filepath, subFile, **kwgs)
+        if target.exists() :
+            self.hits += 1
+            os.utime(target)
+        else :
+            self.misses += 1
+            res = reader()
+            # 每次写入使用唯一的临时文件，同一进程内多个线程写同一缓存也不会冲突。
+            with NamedTemporaryFile(dir=target.parent, prefix=target.name, 
+                                    suffix=".tmp", delete=False) as tmp:
+                tmpfile = Path(tmp.name)
+            try :
+                res.write_ipc(tmpfile, compression="uncompressed")
+                os.replace(tmpfile, target)
+            finally :
+                tmpfile.unlink(missing_ok=True)
+            if target.stat().st_size > self.max_bytes :
+                # 单个数据就超过缓存上限时不保留缓存，直接返回读取结果。
+                target.unlink(missing_ok=True)
+                return res.lazy() if lazy else res
+            self.evict(keep=target)
+        # 未压缩的IPC文件由Polars默认以内存映射方式读取。
+        return pl.scan_ipc(target) if lazy else pl.read_ipc(target)
+    def size(self) -> int:
+        return sum(x.stat().st_size for x in self.cache_dir.glob("*"+frameCache.SUFFIX))
+    def evict(self, max_bytes:int|None = None, keep:Path|None = None) -> None:
+        """
+        按最近使用时间淘汰缓存，直到总大小不超过 max_bytes 。
+        keep - 不淘汰的缓存文件，一般为刚写入的缓存。
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        files = sorted(self.cache_dir.glob("*"+frameCache.SUFFIX), key=lambda x: x.stat().st_mtime)
+        total = sum(x.stat().st_size for x in files)
+        for xfile in files:
+            if total <= limit :
+                break
+            if keep is not None and xfile == keep :
+                continue
+            size = xfile.stat().st_size
+            try :
+                xfile.unlink()
+                total -= size
+            except OSError :
+                # Windows上正在被内存映射的文件无法删除，跳过。
+                continue
+    def invalidate(self, filepath:Path|str, subFile:str|None = None) -> None:
+        """删除某个源文件（或压缩包中的某个文件）的全部缓存。"""
+        for xfile in self.cache_dir.glob("{}-*{}".format(self.__prefix(filepath, subFile),
+                                                         frameCache.SUFFIX)):
+            xfile.unlink(missing_ok=True)
+    def clear(self) -> None:
+        self.evict(max_bytes=0)
+        self.hits = 0
+        self.misses = 0
+
+FRAME_CACHE = None
+
+def set_frame_cache(cache_dir:str|Path|None, 
+                    max_bytes:int = 10 * 2**30) -> frameCache|None:
+    """
+    设置 just_load/szDataFrame/zipreader 默认使用的磁盘缓存，cache_dir 为None时关闭。
+    """
+    global FRAME_CACHE
+    FRAME_CACHE = None if cache_dir is None else frameCache(cache_dir, max_bytes)
+    return FRAME_CACHE
+
+def _get_frame_cache(frame_cache:frameCache|bool|None) -> frameCache|None:
+    if frame_cache is None or frame_cache is True :
+        return FRAME_CACHE
+    return frame_cache if frame_cache else None
+
+def _finish_load(res:pl.DataFrame|pl.LazyFrame, engine:str,
+                 transtype:pl.Expr|list[pl.Expr]|None = None,
+                 columns:list[str]|None = None,
+                 filters:pl.Expr|list[pl.Expr]|None = None
+                 ) -> pl.DataFrame|pl.LazyFrame|pd.DataFrame:
+    if transtype is not None :
+        if checkExpr(transtype, res) :
+            if isinstance(transtype, list) :
+                res = res.with_columns(*transtype)
+            else :
+                res = res.with_columns(transtype)
+        else :
+            raise ValueError("Column Not Found Error !")
+    if filters is not None :
+        res = res.filter(*filters) if isinstance(filters, list) else res.filter(filters)
+    if columns is not None :
+        res = res.select(columns)
+    return to_pandas(res) if engine == "pandas" else res
+
 def just_load(filepath:str|Path, engine:str = "polars", 
               transtype:pl.Expr|list[pl.Expr]|None = None,
-              used_by:str|None = None, **kwgs) -> pl.DataFrame|pd.DataFrame:
-    """load file to DataFrame"""
-    if filepath != Path("No Path") :
-        rFunc = getreader(filepath, used_by)
-        res = rFunc(Path(filepath), **kwgs)
-    else:
-        res = pl.DataFrame()
+              used_by:str|None = None, lazy:bool = False,
+              columns:list[str]|None = None,
+              filters:pl.Expr|list[pl.Expr]|None = None,
+              frame_cache:frameCache|bool|None = None,
+              **kwgs) -> pl.DataFrame|pl.LazyFrame|pd.DataFrame:
+    """
+    load file to DataFrame
+    lazy - 为True时使用 pl.scan_* 惰性读取，返回 pl.LazyFrame ，
+           transtype、columns 与 filters 会被下推到扫描中。
+    columns - 需要保留的列。
+    filters - 行过滤条件，可以是单个表达式或表达式列表。
+    frame_cache - 磁盘缓存（frameCache），None时使用 set_frame_cache 设置的默认缓存，
+                  False时不使用缓存。
+    """
     if engine not in ["polars","pandas"]:
         raise ValueError("engine must be one of {}".format(["polars","pandas"]))
+    if lazy and engine != "polars" :
+        raise ValueError("lazy mode only supports engine = 'polars'")
+    cache = _get_frame_cache(frame_cache)
+    if filepath != Path("No Path") and cache is not None :
+        res = cache.load(filepath, lambda: getreader(filepath, used_by)(Path(filepath), **kwgs),
+                         lazy=lazy, used_by=used_by, **kwgs)
+    elif filepath != Path("No Path") :
+        rFunc = getscanner(filepath, used_by) if lazy else getreader(filepath, used_by)
+        res = rFunc(Path(filepath), **kwgs)
     else:
-        if transtype is None :
-            return res.to_pandas() if engine == "pandas" else res
+        res = pl.LazyFrame() if lazy else pl.DataFrame()
+    return _finish_load(res, engine, transtype, columns, filters)
+
+# 文件夹展开时只保留这些扩展名，避免 .DS_Store 、说明文档等文件导致整批读取失败。
+READABLE_SUFFIXES = frozenset(SCANNERS) | {".xls", ".xlsx", ".tsv", ".json"}
+
+def _expand_paths(pattern_or_paths:str|Path|Iterable[str|Path]) -> list[Path]:
+    if isinstance(pattern_or_paths, (str, Path)) :
+        target = Path(pattern_or_paths)
+        if target.is_dir() :
+            return sorted(x for x in target.iterdir() 
+                          if x.is_file() and x.suffix.lower() in READABLE_SUFFIXES)
+        elif target.exists() :
+            return [target]
         else :
-            if checkExpr(transtype, filepath) :
-                if isinstance(transtype, list) :
-                    res = res.with_columns(*transtype)
-                else :
-                    res = res.with_columns(transtype)
-                return res.to_pandas() if engine == "pandas" else res
-            else :
-                raise ValueError("Column Not Found Error !")
+            return [Path(x) for x in sorted(glob(str(pattern_or_paths), recursive=True))]
+    return [Path(x) for x in pattern_or_paths]
+
+def load_many(pattern_or_paths:str|Path|Iterable[str|Path], engine:str = "polars",
+              transtype:pl.Expr|list[pl.Expr]|None = None,
+              used_by:str|None = None,
+              schema_overrides:Mapping[str, pl.DataType]|None = None,
+              source_column:str|None = None,
+              max_workers:int|None = None,
+              how:str = "diagonal_relaxed", **kwgs) -> pl.DataFrame|pd.DataFrame:
+    """
+    并行读取多个文件并合并为一个DataFrame。
+    pattern_or_paths - 文件夹、glob通配符（如 "data/*.csv"）或文件路径列表。
+                       文件夹只读取 READABLE_SUFFIXES 中的格式，其他扩展名请使用通配符。
+    schema_overrides - 读取后按列名统一数据类型，文件中不存在的列会被忽略。
+    source_column - 不为None时，添加一列记录数据来源的文件名。
+    max_workers - 线程数，默认由 ThreadPoolExecutor 决定（Polars读取时会释放GIL）。
+    how - pl.concat 的合并方式，默认 "diagonal_relaxed" 以对齐不同文件的列。
+    """
+    if engine not in ["polars","pandas"]:
+        raise ValueError("engine must be one of {}".format(["polars","pandas"]))
+    paths = _expand_paths(pattern_or_paths)
+    if not paths :
+        raise ValueError("No file matched {}!".format(pattern_or_paths))
+    def loadOne(filepath:Path) -> pl.DataFrame:
+        res = just_load(filepath, transtype=transtype, used_by=used_by, **kwgs)
+        if schema_overrides is not None :
+            res = res.with_columns([pl.col(ke).cast(vd) for ke,vd in schema_overrides.items()
+                                    if ke in res.columns])
+        if source_column is not None :
+            res = res.with_columns(pl.lit(filepath.name).alias(source_column))
+        return res
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        data = list(executor.map(loadOne, paths))
+    res = pl.concat(data, how=how, rechunk=True)
+    return to_pandas(res) if engine == "pandas" else res
+
+def _rebatch(frames:Iterable[pl.DataFrame], batch_size:int) -> Iterator[pl.DataFrame]:
+    # 把大小不一的数据块重新切分为固定行数（最后一块可能不足）。
+    buffer, nrows = [], 0
+    for frame in frames:
+        while frame.height > 0 :
+            take = min(batch_size - nrows, frame.height)
+            buffer.append(frame.slice(0, take))
+            frame = frame.slice(take)
+            nrows += take
+            if nrows == batch_size :
+                yield pl.concat(buffer, rechunk=True)
+                buffer, nrows = [], 0
+    if buffer :
+        yield pl.concat(buffer, rechunk=True)
+
+def _lazy_slices(data:pl.LazyFrame, n_rows:int) -> Iterator[pl.DataFrame]:
+    offset = 0
+    while True :
+        frame = data.slice(offset, n_rows).collect()
+        if frame.height == 0 :
+            break
+        yield frame
+        if frame.height < n_rows :
+            break
+        offset += n_rows
 
 class szDataFrame(object):
     """
-    简单的数据处理。不提供超大数据集的惰性加载。
+    简单的数据处理。
+    lazy=True 时以 pl.LazyFrame 惰性加载超大数据集，直到 get/convert/collect 时才真正读取。
     提供常见的数据处理方法，包括：
     1. 时间序列处理
     2. 训练/测试数据处理
@@ -165,29 +581,40 @@ class szDataFrame(object):
     """
     __ENGINES = ["polars","pandas"]
     def __init__(self, filepath:str|None, engine:str = "polars", 
-                 from_data:pl.DataFrame|pd.DataFrame|None = None, **kwgs) -> None:
+                 from_data:pl.DataFrame|pl.LazyFrame|pd.DataFrame|None = None,
+                 lazy:bool = False, **kwgs) -> None:
         if engine not in szDataFrame.__ENGINES:
             raise ValueError("engine must be one of {}".format(szDataFrame.__ENGINES))
         if from_data is None :
-            self.__data = just_load(filepath, engine, **kwgs)
+            self.__data = just_load(filepath, engine, lazy=lazy, **kwgs)
         else:
-            if isinstance(from_data, pl.DataFrame):
+            if isinstance(from_data, (pl.DataFrame, pl.LazyFrame)):
                 self.__data = from_data
             else:
                 self.__data = pl.from_pandas(from_data)
+        if isinstance(self.__data, pd.DataFrame):
+            self.__data = pl.from_pandas(self.__data)
         self.__filepath = Path(filepath) if filepath else None
+        self.__pandas = {}
     def __repr__(self) -> str:
         return self.__data.__repr__()
     def __str__(self) -> str:
         return self.__data.__str__()
     def __len__(self) -> int:
+        if self.is_lazy :
+            return self.__data.select(pl.len()).collect().item()
         return len(self.__data)
     @property
+    def is_lazy(self) -> bool:
+        return isinstance(self.__data, pl.LazyFrame)
+    @property
     def shape(self) -> tuple:
+        if self.is_lazy :
+            return (len(self), len(self.columns))
         return self.__data.shape
     @property
     def columns(self) -> list:
-        return self.__data.columns
+        return dataframeColumns(self.__data)
     @property
     def stat(self) -> stat_result|None:
         if self.__filepath is None:
@@ -195,36 +622,221 @@ class szDataFrame(object):
         else :
             res = self.__filepath.stat()
         return res
-    def get(self, type:str = "polars") -> pl.DataFrame|pd.DataFrame:
+    def collect(self, **kwgs) -> Self:
+        """执行惰性计算，返回非惰性的 szDataFrame 。"""
+        if not self.is_lazy :
+            return self
+        return szDataFrame(filepath=self.__filepath, from_data=self.__data.collect(**kwgs))
+    def lazy(self) -> pl.LazyFrame:
+        return self.__data if self.is_lazy else self.__data.lazy()
+    def __eager(self) -> pl.DataFrame:
+        return self.__data.collect() if self.is_lazy else self.__data
+    def __to_pandas(self, arrow:bool|None = None) -> pd.DataFrame:
+        # 数据本身不会被修改，每种转换方式只转换一次。
+        # 返回的是共享对象，需要修改时请先 copy() 。
+        use_arrow = use_pandas_arrow(arrow)
+        if use_arrow not in self.__pandas :
+            self.__pandas[use_arrow] = to_pandas(self.__eager(), arrow=use_arrow)
+        return self.__pandas[use_arrow]
+    def get(self, type:str = "polars", arrow:bool|None = None) -> pl.DataFrame|pd.DataFrame:
+        """
+        获取数据。
+        arrow - 转换为pandas时是否使用Arrow扩展类型，None时使用 set_pandas_arrow 的默认设置。
+        """
         if type not in szDataFrame.__ENGINES:
             raise ValueError("type must be one of {}".format(szDataFrame.__ENGINES))
-        return self.__data if type == "polars" else self.__data.to_pandas()
-    def convert(self, to:str) -> any:
-        funx = getattr(self.__data, "to_{}".format(to), None)
+        return self.__eager() if type == "polars" else self.__to_pandas(arrow)
+    def convert(self, to:str, arrow:bool|None = None) -> any:
+        if to == "pandas" :
+            return self.__to_pandas(arrow)
+        data = self.__eager()
+        funx = getattr(data, "to_{}".format(to), None)
         if to == "polars" :
-            return self.__data
+            return data
         if funx is None:
             raise ValueError("Don't have this convert method!")
         return funx()
+    def iter_batches(self, batch_size:int = 50_000) -> Iterator[pl.DataFrame]:
+        """
+        按批次迭代数据，每批 batch_size 行（最后一批可能不足）。
+        惰性数据（lazy=True）使用Polars流式引擎从源文件逐块读取（csv按块解析，parquet按行组读取），
+        内存占用只与 batch_size 有关；非惰性数据则直接切片。
+        """
+        if not self.is_lazy :
+            yield from self.__data.iter_slices(n_rows=batch_size)
+        elif hasattr(self.__data, "collect_batches") :
+            yield from _rebatch(self.__data.collect_batches(chunk_size=batch_size), batch_size)
+        else :
+            # 旧版本Polars没有 collect_batches ，使用切片下推逐段读取。
+            yield from _lazy_slices(self.__data, batch_size)
+    def iter_slices(self, n_rows:int = 10_000) -> Iterator[pl.DataFrame]:
+        """
+        按行数切片迭代。非惰性数据为零拷贝切片；
+        惰性数据每次只读取 [offset, offset+n_rows) 行，适合parquet/ipc等可随机读取的文件。
+        """
+        if self.is_lazy :
+            yield from _lazy_slices(self.__data, n_rows)
+        else :
+            yield from self.__data.iter_slices(n_rows=n_rows)
     def append(self, other:Self) -> Self:
-        data = self.__data.vstack(other.get())
+        if self.is_lazy or other.is_lazy :
+            data = pl.concat([self.lazy(), other.lazy()])
+        else :
+            data = self.__data.vstack(other.get())
         return szDataFrame(filepath=self.__filepath, from_data=data)
     def train_test_split(self, test_size:float|int|None = None, 
                          train_size:float|int|None = None) -> tuple[Self, Self]:
-        train, test = train_test_split(self.__data, test_size, train_size)
+        from pmdarima.model_selection import train_test_split
+        train, test = train_test_split(self.__eager(), test_size, train_size)
         return szDataFrame(filepath=self.__filepath, from_data=train), \
                szDataFrame(filepath=self.__filepath, from_data=test)
 
 
-def zipreader(zipFilepath:Path|str, subFile:str, 
-              transtype:pl.Expr|list[pl.Expr]|None = None, **kwgs) -> szDataFrame:
-    with TemporaryDirectory() as tmpdirname:
+SPOOL_SIZE = 64 * 2**20
+
+class archiveCache(object):
+    """
+    zip压缩包句柄的LRU缓存。
+    以 fileIdentity (路径, 修改时间, 大小) 为键，缓存打开的 ZipFile 及其已解析的中央目录，
+    并在 schemas (schemaRegistry) 中缓存各成员文件的列结构。
+    文件被修改后键随之改变，旧的句柄会被淘汰。
+    maxsize - 最多保留的压缩包句柄数量。
+    schema_maxsize - 最多保留的列结构数量。
+    """
+    def __init__(self, maxsize:int = 8, schema_maxsize:int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.schemas = schemaRegistry(schema_maxsize)
+        self.__handles = OrderedDict()
+        self.__lock = RLock()
+    def __len__(self) -> int:
+        return len(self.__handles)
+    def __repr__(self) -> str:
+        return "archiveCache(size={}/{}, schemas={}, hits={}, misses={})".format(
+            len(self.__handles), self.maxsize, len(self.schemas), self.hits, self.misses)
+    def open(self, zipFilepath:Path|str) -> tuple[ZipFile, frozenset]:
+        """返回缓存的 ZipFile 句柄与成员名称集合。"""
+        key = fileIdentity(zipFilepath)
+        with self.__lock:
+            if key in self.__handles :
+                self.hits += 1
+                self.__handles.move_to_end(key)
+                return self.__handles[key]
+            self.misses += 1
+            # 只丢弃引用，正在被其他线程使用的句柄会在引用释放后自动关闭。
+            for okey in [x for x in self.__handles if x[0] == key[0]]:
+                del self.__handles[okey]
+            archive = ZipFile(key[0], "r")
+            self.__handles[key] = (archive, frozenset(archive.namelist()))
+            while len(self.__handles) > self.maxsize :
+                self.__handles.popitem(last=False)
+            return self.__handles[key]
+    def get_schema(self, zipFilepath:Path|str, subFile:str, 
+                   **kwgs) -> pl.Schema|None:
+        return self.schemas.get((fileIdentity(zipFilepath), subFile, 
+                                 repr(sorted(kwgs.items()))))
+    def set_schema(self, zipFilepath:Path|str, subFile:str, 
+                   schema:pl.Schema, **kwgs) -> None:
+        self.schemas.set((fileIdentity(zipFilepath), subFile, 
+                          repr(sorted(kwgs.items()))), schema)
+    def invalidate(self, zipFilepath:Path|str) -> None:
+        """移除某个压缩包的全部缓存。"""
+        path = str(Path(zipFilepath).absolute())
+        with self.__lock:
+            for key in [x for x in self.__handles if x[0] == path]:
+                del self.__handles[key]
+        self.schemas.invalidate(zipFilepath)
+    def clear(self) -> None:
+        with self.__lock:
+            self.__handles.clear()
+            self.hits = 0
+            self.misses = 0
+        self.schemas.clear()
+
+ARCHIVE_CACHE = archiveCache()
+
+def _open_member(archive:ZipFile, subFile:str, 
+                 spool_size:int = SPOOL_SIZE) -> IO[bytes]:
+    """
+    只解压压缩包中的指定文件。
+    不超过 spool_size 的文件直接读入内存，更大的文件写入 SpooledTemporaryFile 。
+    """
+    info = archive.getinfo(subFile)
+    if info.file_size <= spool_size :
+        return BytesIO(archive.read(info))
+    buffer = SpooledTemporaryFile(max_size=spool_size)
+    with archive.open(info) as member:
+        shutil.copyfileobj(member, buffer, 2**20)
+    buffer.seek(0)
+    return buffer
+
+def _read_member(zipFilepath:Path|str, subFile:str, used_by:str|None,
+                 spool_size:int, cache:bool, **kwgs) -> pl.DataFrame:
+    if cache :
+        teZip, subFiles = ARCHIVE_CACHE.open(zipFilepath)
+        if subFile not in subFiles:
+            raise ValueError("'{}' not in zip-file({})!".format(subFile,zipFilepath))
+        with _open_member(teZip, subFile, spool_size) as buffer:
+            res = getreader(subFile, used_by)(buffer, **kwgs)
+        ARCHIVE_CACHE.set_schema(zipFilepath, subFile, res.schema, 
+                                 used_by=used_by, **kwgs)
+    else :
         with ZipFile(Path(zipFilepath), "r") as teZip:
-            teZip.extractall(path = tmpdirname)
-            subFiles = teZip.namelist()
+            if subFile not in teZip.namelist():
+                raise ValueError("'{}' not in zip-file({})!".format(subFile,zipFilepath))
+            with _open_member(teZip, subFile, spool_size) as buffer:
+                res = getreader(subFile, used_by)(buffer, **kwgs)
+    return res
+
+def zipColumns(zipFilepath:Path|str, subFile:str, 
+               used_by:str|None = None, **kwgs) -> list[str]:
+    """
+    获取压缩包内文件的列名。
+    优先使用 ARCHIVE_CACHE 中缓存的列结构，未命中时只解压并解析表头，并缓存结果。
+    """
+    schema = ARCHIVE_CACHE.get_schema(zipFilepath, subFile, used_by=used_by, **kwgs)
+    if schema is None :
+        teZip, subFiles = ARCHIVE_CACHE.open(zipFilepath)
         if subFile not in subFiles:
             raise ValueError("'{}' not in zip-file({})!".format(subFile,zipFilepath))
-        return szDataFrame(Path(tmpdirname)/subFile, transtype = transtype, **kwgs)
+        kind = used_by if used_by else Path(subFile).suffix.lower()[1:]
+        if kind in ["xls","xlsx","excel"] :
+            # Excel 读取器不接受 ZipExtFile ，需要先解压到内存。
+            with _open_member(teZip, subFile) as buffer:
+                schema = _probe_source(buffer, subFile, used_by, **kwgs)
+        else :
+            with teZip.open(subFile) as member:
+                schema = _probe_source(member, subFile, used_by, **kwgs)
+        ARCHIVE_CACHE.set_schema(zipFilepath, subFile, schema, used_by=used_by, **kwgs)
+    return schema.names()
+
+def zipreader(zipFilepath:Path|str, subFile:str, 
+              transtype:pl.Expr|list[pl.Expr]|None = None,
+              engine:str = "polars", used_by:str|None = None,
+              lazy:bool = False, columns:list[str]|None = None,
+              filters:pl.Expr|list[pl.Expr]|None = None,
+              spool_size:int = SPOOL_SIZE, cache:bool = True,
+              frame_cache:frameCache|bool|None = None,
+              **kwgs) -> szDataFrame:
+    """
+    读取zip压缩包中的单个文件。
+    只解压 subFile 本身，不会把整个压缩包释放到磁盘。
+    spool_size - 超过该字节数的文件会使用临时文件缓冲，默认64MB。
+    cache - 是否使用 ARCHIVE_CACHE 复用已打开的压缩包句柄。
+            缓存的句柄会保持文件打开（Windows上会占用该文件），
+            可以使用 ARCHIVE_CACHE.invalidate(path) 或 ARCHIVE_CACHE.clear() 释放。
+    frame_cache - 磁盘缓存，用法与 just_load 相同。
+    """
+    fcache = _get_frame_cache(frame_cache)
+    if fcache is not None :
+        res = fcache.load(zipFilepath, 
+                          lambda: _read_member(zipFilepath, subFile, used_by, spool_size, cache, **kwgs),
+                          subFile=subFile, used_by=used_by, **kwgs)
+    else :
+        res = _read_member(zipFilepath, subFile, used_by, spool_size, cache, **kwgs)
+    res = _finish_load(res.lazy() if lazy else res, "polars", transtype, columns, filters)
+    return szDataFrame(zipFilepath, engine=engine, from_data=res)
 
 if __name__ == "__main__":
     rootpath = Path(__file__).absolute().parent.parent
@@ -19,38 +19,94 @@
 # 这是一个把pandas/polars的DataFrame数据保存成一个具有格式的excel文件。
 # 例如把计算好的结算数据写到excel文件中，依照格式直接形成结算表。
 
+from copy import copy
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.worksheet import cell_range
 import itertools
-from openpyxl.utils.cell import get_column_letter, cols_from_range, coordinate_from_string
+from openpyxl.utils.cell import (get_column_letter, cols_from_range, coordinate_from_string,
+                                 column_index_from_string, range_boundaries)
+from collections import Counter
 from collections.abc import Iterable
-from typing import Self
+from threading import RLock
+from typing import Self, Callable
 from numbers import Number
+import multiprocessing
+import time
 
 
 import pandas as pd
 import polars as pl
 
-__all__ = ["transColname2Letter", "saveExcel"]
+__all__ = ["transColname2Letter", "styleRegistry", "STYLE_REGISTRY", "saveExcel", "save_many"]
+
+def _freeze(obj) -> object:
+    """把样式参数（可能嵌套的dict/list）转换为可哈希的键。"""
+    if isinstance(obj, dict) :
+        return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)) :
+        return tuple(_freeze(x) for x in obj)
+    return obj
+
+class styleRegistry(object):
+    """
+    共享的样式对象注册表。
+    相同参数的 Font/Alignment/PatternFill/Side/Border 只创建一次，之后按引用复用，
+    openpyxl 保存时不必再对大量重复的样式对象去重。
+    allocated - 按类型统计实际创建的样式对象数量；hits - 复用次数。
+    """
+    def __init__(self) -> None:
+        self.allocated = Counter()
+        self.hits = 0
+        self.__styles = {}
+        self.__lock = RLock()
+    def __len__(self) -> int:
+        return len(self.__styles)
+    def __repr__(self) -> str:
+        return "styleRegistry(styles={}, allocated={}, hits={})".format(
+            len(self.__styles), dict(self.allocated), self.hits)
+    def get(self, kind:str, factory:Callable, **kwargs) -> object:
+        key = (kind, _freeze(kwargs))
+        with self.__lock:
+            res = self.__styles.get(key)
+            if res is None :
+                res = factory(**kwargs)
+                self.__styles[key] = res
+                self.allocated[kind] += 1
+            else :
+                self.hits += 1
+            return res
+    def font(self, **kwargs) -> Font:
+        return self.get("Font", Font, **kwargs)
+    def alignment(self, **kwargs) -> Alignment:
+        return self.get("Alignment", Alignment, **kwargs)
+    def fill(self, **kwargs) -> PatternFill:
+        return self.get("PatternFill", PatternFill, **kwargs)
+    def side(self, **kwargs) -> Side:
+        return self.get("Side", Side, **kwargs)
+    def border(self, types:dict|None = None) -> Border:
+        """边框样式，types 中没有给出的边使用虚线。"""
+        types = types if types else {}
+        def factory(**kwargs) -> Border:
+            return Border(**{x: self.side(**types[x]) if x in types.keys() else self.side(border_style="dotted")
+                             for x in ["left", "right", "top", "bottom"]})
+        return self.get("Border", factory, types=types)
+    def clear(self) -> None:
+        with self.__lock:
+            self.__styles.clear()
+            self.allocated.clear()
+            self.hits = 0
+
+STYLE_REGISTRY = styleRegistry()
 
 def cellBorder(types:dict = None) -> Border:
     """
-    生成边框样式。
+    生成边框样式，相同的边框只创建一次。
     """
-    if types :
-        nomorlBorder = Border(
-            left = Side(**types["left"]) if "left" in types.keys() else Side(border_style="dotted"),
-            right= Side(**types["right"]) if "right" in types.keys() else Side(border_style="dotted"),
-            top = Side(**types["top"]) if "top" in types.keys() else Side(border_style="dotted"),
-            bottom = Side(**types["bottom"]) if "bottom" in types.keys() else Side(border_style="dotted"))
-    else:
-        nomorlBorder = Border(left = Side(border_style="dotted"),
-                              right= Side(border_style="dotted"),
-                              top = Side(border_style="dotted"),
-                              bottom = Side(border_style="dotted"))
-    return nomorlBorder
+    return STYLE_REGISTRY.border(types)
 
 def transColname2Letter(colnames:list[str],
                         xlsDataRange:str|None = None) -> dict[str]:
@@ -65,12 +121,20 @@ def transColname2Letter(colnames:list[str],
 class saveExcel(object):
     """
     保存DataFrame到excel文件。
+    write_only - 流式写入模式（openpyxl write_only），每一行连同样式在写入时直接输出，
+                 不在内存中保留整张表，适合几十万行的大表。这个模式节省的是内存（约为普通模式的一半），
+                 速度与普通模式相近，单元格的XML序列化仍由openpyxl逐个完成。此模式下：
+                 1. 只能按顺序写入（writeTitle、writeData、writeSummaryData），不支持 writeSpecialThings ；
+                 2. setColumnsWidth 必须在写入第一行之前调用。
     """
     def __init__(self, filename:str|Path, 
-                 startRow:int = 1, startColumn:int = 1) -> None:
+                 startRow:int = 1, startColumn:int = 1,
+                 write_only:bool = False) -> None:
         self.__filename = filename
-        self.__wb = Workbook()
+        self.__write_only = write_only
+        self.__wb = Workbook(write_only=write_only)
         self.__ws = None
+        self.__written = 0
         self.__startRow = startRow
         self.__startColumn = startColumn
         self.__rowplace = None
@@ -79,6 +143,8 @@ class saveExcel(object):
         self.__data_length = None
         self.__data_width = None
         self.__columns_sort = None
+        self.__formats = None
+        self.__sheets = {}
     def __make_nextpoint(self, plus_n:str = 0) -> None:
         if plus_n < 0 :
             raise ValueError("plus_n must be greater than 0")
@@ -91,11 +157,107 @@ class saveExcel(object):
             epoint = "{}{}".format(get_column_letter(self.__data_width+self.__startColumn-1),
                                    self.__rowplace+plus_n+1)
         self.__nextPoint = (spoint, epoint)
+    def __pointRows(self) -> tuple[int, int]:
+        return (coordinate_from_string(self.__nextPoint[0])[1], 
+                coordinate_from_string(self.__nextPoint[1])[1])
+    def __writeBlock(self, values:list[list], styles:list[dict],
+                     border_type:dict|None = None, border_per_row:bool = False,
+                     height:int|None = None) -> None:
+        """
+        批量写入 self.__nextPoint 所在的行。
+        values - 各行的值，行数少于区域行数时其余行只写样式。
+        styles - 每列的样式，如 {"font":..., "alignment":..., "fill":..., "number_format":...} 。
+        border_type - 边框，与 __setRowBorder 相同：区域左上角为left、右下角为right、其余为middle；
+                      border_per_row 为True时每一行单独按 left/middle/right 设置。
+        列字母、样式与边框对象只生成一次，每个单元格只做一次赋值。
+        write_only模式下每种行样式只建一组 WriteOnlyCell 模板，逐行换值后 append ；
+        普通模式下按行列号直接写入单元格。
+        """
+        r0, r1 = self.__pointRows()
+        if self.__write_only :
+            if r0 <= self.__written :
+                raise ValueError("write_only mode can only write rows in order.")
+            while self.__written < r0 - 1 :
+                self.__ws.append([])
+                self.__written += 1
+        lastc = self.__data_width - 1
+        # 每种 (边框位置, 列) 组合只设置一次样式，之后的单元格直接复制样式索引。
+        templates = {}
+        def template(kind:str|None, c:int) -> WriteOnlyCell:
+            if (kind, c) not in templates :
+                cell = WriteOnlyCell(self.__ws)
+                for k, v in styles[c].items():
+                    setattr(cell, k, v)
+                if kind :
+                    cell.border = cellBorder(border_type[kind])
+                templates[(kind, c)] = cell
+            return templates[(kind, c)]
+        def kind_of(r:int, c:int) -> str|None:
+            if not border_type :
+                return None
+            if (r == r0 or border_per_row) and c == 0 :
+                return "left"
+            if (r == r1 or border_per_row) and c == lastc :
+                return "right"
+            return "middle"
+        pad = [None] * (self.__startColumn - 1)
+        rowcells = {}
+        for r in range(r0, r1+1):
+            if height :
+                self.__ws.row_dimensions[r].height = height
+            rvals = values[r-r0] if r-r0 < len(values) else []
+            if self.__write_only :
+                # append 时各单元格立即写出，同一行模板可以逐行换值复用，不再为每个值新建单元格。
+                key = (r == r0, r == r1)
+                if key not in rowcells :
+                    rowcells[key] = [template(kind_of(r, c), c) for c in range(self.__data_width)]
+                for cell, v in itertools.zip_longest(rowcells[key], rvals[:self.__data_width]):
+                    cell.value = v
+                self.__ws.append(pad + rowcells[key])
+                self.__written += 1
+            else :
+                for c in range(self.__data_width):
+                    cell = self.__ws.cell(row=r, column=self.__startColumn+c)
+                    if c < len(rvals) :
+                        cell.value = rvals[c]
+                    cell._style = copy(template(kind_of(r, c), c)._style)
+        self.__rowplace = r1
+    def __storeCursor(self) -> None:
+        if self.__ws is not None :
+            self.__sheets[self.__ws.title] = (self.__ws, self.__rowplace, 
+                                              self.__nextPoint, self.__written)
     def actionNewSheet(self, sheetname:str|None = None, 
                        need_gridline:bool = False) -> None:
-        self.__ws = self.__wb.active
+        """
+        新建工作表并切换到该表，之后的写入都在这个表中进行。
+        每个工作表各自记录写入位置，可以用 switchSheet 切换回之前的表继续写入。
+        第一次调用时使用工作簿自带的工作表。
+        """
+        sheetname = sheetname if sheetname else "Sheet{}".format(len(self.__sheets)+1)
+        if sheetname in self.__sheets :
+            raise ValueError("Sheet {} already exists.".format(sheetname))
+        self.__storeCursor()
+        if self.__write_only or self.__sheets :
+            self.__ws = self.__wb.create_sheet(title=sheetname)
+        else :
+            self.__ws = self.__wb.active
+            self.__ws.title = sheetname
+        self.__rowplace = None
+        self.__nextPoint = None
+        self.__written = 0
         self.__ws.sheet_view.showGridLines = need_gridline
-        self.__ws.title = sheetname if sheetname else "Sheet1"
+        self.__storeCursor()
+    def switchSheet(self, sheetname:str) -> None:
+        """
+        切换到已经建立的工作表，从该表上次写入的位置继续写入。
+        """
+        if sheetname not in self.__sheets :
+            raise ValueError("Sheet {} does not exist.".format(sheetname))
+        self.__storeCursor()
+        self.__ws, self.__rowplace, self.__nextPoint, self.__written = self.__sheets[sheetname]
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self.__sheets.keys())
     def save(self) -> None:
         self.__wb.save(self.__filename)
     def __enter__(self) -> Self:
@@ -103,7 +265,14 @@ class saveExcel(object):
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.save()
     def usingData(self, data:pd.DataFrame|pl.DataFrame,
-                  usingSortCols:list[str]|None = None) -> None:
+                  usingSortCols:list[str]|None = None,
+                  numberformat:dict|str|None = None) -> None:
+        """
+        设定要写入的数据。
+        numberformat - 数据的数字格式，dict 以列名（或列字母）为键，str 则所有列使用同一格式。
+                       写入数据行（writeData）与汇总行（writeSummaryData）时随单元格一起设置，
+                       写入时给出的 numberformat 会覆盖这里对应列的格式。
+        """
         self.__data = data
         self.__data_length, self.__data_width = self.__data.shape
         if isinstance(self.__data, pl.DataFrame) :
@@ -113,66 +282,79 @@ class saveExcel(object):
         else:
             self.__columns_sort = self.__data.columns.to_list()
         self.__data = self.__data[self.__columns_sort]
+        self.__formats = None
+        if numberformat :
+            self.__formats = self.__resolveFormats(numberformat)
     def __setRowBorder(self, startpoint:int, endpoint:int, 
                      left = None, middle = None, right = None) -> None:
         """
         按照行来设置单元格边框样式。
         """
+        left, middle, right = cellBorder(left), cellBorder(middle), cellBorder(right)
         for cell in itertools.chain(*self.__ws[startpoint:endpoint]):
             if cell.coordinate == startpoint :
-                cell.border =  cellBorder(left)
+                cell.border = left
             elif cell.coordinate == endpoint :
-                cell.border =  cellBorder(right)
+                cell.border = right
             else:
-                cell.border =  cellBorder(middle)
+                cell.border = middle
     def __getColumnsRange(self) -> list:
-        res = []
-        sP = get_column_letter(self.__startColumn)
-        eP = get_column_letter(self.__data_width+self.__startColumn-1)
-        for i in itertools.chain(*cols_from_range("{}1:{}1".format(sP,eP))):
-            tmp = coordinate_from_string(i)
-            res.append(tmp[0])
-        res = list(set(res))
-        res.sort()
-        return res
+        return [get_column_letter(self.__startColumn+i) for i in range(self.__data_width)]
     def __columns_to_letter(self, colname:str|list[str]|None = None):
+        """colname 可以是列名或列字母，与 numberformat 的键相同，列名优先。"""
         if colname :
-            allCNs = self.__data.columns.to_list()
             allLs = self.__getColumnsRange()
+            def toLetter(name:str) -> str:
+                if name in self.__columns_sort :
+                    return allLs[self.__columns_sort.index(name)]
+                elif name in allLs :
+                    return name
+                raise ValueError("'{}' is neither a column name nor a column letter.".format(name))
             if isinstance(colname, str):
-                return allLs[allLs.index(colname)]
+                return toLetter(colname)
             else:
-                return [allLs[allLs.index(i)] for i in colname]
+                return [toLetter(i) for i in colname]
         else :
             return self.__getColumnsRange()
+    def __resolveFormats(self, numberformat:dict|str|None = None) -> list[str|None]:
+        """
+        把数字格式转换为按列位置排列的列表，None 表示该列不设置格式。
+        numberformat 为 None 时使用 usingData 给出的格式；为 dict 时在其基础上覆盖对应列，
+        键可以是列名或列字母。
+        """
+        base = list(self.__formats) if self.__formats else [None] * self.__data_width
+        if numberformat is None :
+            return base
+        if isinstance(numberformat, str) :
+            return [numberformat] * self.__data_width
+        for i, (name, letter) in enumerate(zip(self.__columns_sort, self.__getColumnsRange())):
+            if name in numberformat :
+                base[i] = numberformat[name]
+            elif letter in numberformat :
+                base[i] = numberformat[letter]
+        return base
     def __setNumberFormat(self, giveRange:str|None = None,
                           sformat:str|dict = 'General') -> None:
         """
-        设定数字格式。
+        按列设定数字格式。
+        giveRange 为空时使用当前写入区域；sformat 为 dict 时以列字母为键，为 str 时整个区域使用同一格式。
+        以整数行列号按列遍历（iter_cols），不再逐个拼接和解析单元格坐标。
         """
-        if giveRange :
-            cellrange = giveRange
-            colist = []
-            for i in itertools.chain(*cols_from_range(giveRange)):
-                tmp = coordinate_from_string(i)
-                colist.append(tmp[0])
-            colist = list(set(colist))
-            colist.sort()
-        else:
-            cellrange = "{}:{}".format(*self.__nextPoint)
-            colist = self.__getColumnsRange()
-        crkey = cell_range.CellRange(range_string=cellrange).bounds 
-        rolist = list(range(crkey[1],crkey[3]+1))
-        if isinstance(sformat, dict):
-            for icol in sformat.keys():
-                if icol in colist :
-                    cellist = ["{}{}".format(*x) for x in list(itertools.product([icol], rolist))]
-                    for cellname in cellist:
-                        self.__ws[cellname].number_format = sformat[icol]
-        else:
-            cellist = ["{}{}".format(*x) for x in list(itertools.product(rolist, colist))]
-            for cellname in cellist:
-                self.__ws[cellname].number_format = sformat
+        if self.__write_only :
+            raise ValueError("write_only mode can not format cells after they are written.")
+        cellrange = giveRange if giveRange else "{}:{}".format(*self.__nextPoint)
+        min_col, min_row, max_col, max_row = range_boundaries(cellrange)
+        if isinstance(sformat, dict) :
+            colfmt = {column_index_from_string(k): v for k, v in sformat.items()}
+        else :
+            colfmt = dict.fromkeys(range(min_col, max_col+1), sformat)
+        for icol, fmt in colfmt.items():
+            if not (min_col <= icol <= max_col) :
+                continue
+            for col in self.__ws.iter_cols(min_row=min_row, max_row=max_row,
+                                           min_col=icol, max_col=icol):
+                for cell in col:
+                    cell.number_format = fmt
     def writeTitle(self, title:str, crossline:int = 0,
                    font_type:dict|None = None, 
                    border_type:dict|None = None, height:int = 75) -> None:
@@ -180,15 +362,20 @@ class saveExcel(object):
         写入标题。
         """
         if font_type :
-            fontype = Font(**font_type["font"]) if "font" in font_type.keys() else Font(name='微软雅黑', 
-                                                                                        size=23, 
-                                                                                        bold=True)
-            aligtype = Alignment(**font_type["align"]) if "align" in font_type.keys() else Alignment(horizontal="center",
-                                                                                                     vertical="center")
+            fontype = STYLE_REGISTRY.font(**font_type["font"]) if "font" in font_type.keys() else STYLE_REGISTRY.font(name='微软雅黑', 
+                                                                                                                      size=23, 
+                                                                                                                      bold=True)
+            aligtype = STYLE_REGISTRY.alignment(**font_type["align"]) if "align" in font_type.keys() else STYLE_REGISTRY.alignment(horizontal="center",
+                                                                                                                                   vertical="center")
         else:
-            fontype = Font(name='微软雅黑', size=23, bold=True)
-            aligtype = Alignment(horizontal="center",vertical="center")
+            fontype = STYLE_REGISTRY.font(name='微软雅黑', size=23, bold=True)
+            aligtype = STYLE_REGISTRY.alignment(horizontal="center",vertical="center")
         self.__make_nextpoint(plus_n=crossline)
+        if self.__write_only :
+            self.__ws.merged_cells.add("{}:{}".format(*self.__nextPoint))
+            styles = [{"font": fontype, "alignment": aligtype}] + [{}] * (self.__data_width - 1)
+            self.__writeBlock([[title]], styles, border_type=border_type, height=height)
+            return
         self.__ws.merge_cells("{}:{}".format(*self.__nextPoint))
         self.__ws[self.__nextPoint[0]].value = title
         self.__ws[self.__nextPoint[0]].font = fontype
@@ -206,57 +393,49 @@ class saveExcel(object):
         self.__rowplace = self.__ws[self.__nextPoint[1]].row
     def __writeRowData(self, value:Iterable, font_type:dict|None = None, 
                        border_type:dict|None = None, crossline:int = 0,
-                       numberformat:dict|str = "General",
-                       height:int = 50) -> None:
+                       numberformat:list[str|None]|None = None,
+                       height:int = 50, border_per_row:bool = False) -> None:
         if font_type :
-            fontype = Font(**font_type["font"]) if "font" in font_type.keys() else Font(name='微软雅黑', 
-                                                                                        size=11.5, 
-                                                                                        bold=True)
-            aligtype = Alignment(**font_type["align"]) if "align" in font_type.keys() else Alignment(horizontal="center",
-                                                                                                     vertical="center",
-                                                                                                     wrapText = True)
-            filltype = PatternFill(**font_type["fill"]) if "fill" in font_type.keys() else PatternFill(patternType=None)
+            fontype = STYLE_REGISTRY.font(**font_type["font"]) if "font" in font_type.keys() else STYLE_REGISTRY.font(name='微软雅黑', 
+                                                                                                                      size=11.5, 
+                                                                                                                      bold=True)
+            aligtype = STYLE_REGISTRY.alignment(**font_type["align"]) if "align" in font_type.keys() else STYLE_REGISTRY.alignment(horizontal="center",
+                                                                                                                                   vertical="center",
+                                                                                                                                   wrapText = True)
+            filltype = STYLE_REGISTRY.fill(**font_type["fill"]) if "fill" in font_type.keys() else STYLE_REGISTRY.fill(patternType=None)
         else:
-            fontype = Font(name='微软雅黑', size=11.5, bold=True)
-            aligtype = Alignment(horizontal="center",vertical="center")
-            filltype = PatternFill(patternType=None)
+            fontype = STYLE_REGISTRY.font(name='微软雅黑', size=11.5, bold=True)
+            aligtype = STYLE_REGISTRY.alignment(horizontal="center",vertical="center")
+            filltype = STYLE_REGISTRY.fill(patternType=None)
         self.__make_nextpoint(plus_n=crossline)
-        for irow in value:
-            tmp = dict(zip(self.__getColumnsRange(),irow))
-            self.__ws.append(tmp)
-        for cell in itertools.chain(*self.__ws[self.__nextPoint[0]:self.__nextPoint[1]]) :
-            cell.font = fontype
-            cell.alignment = aligtype
-            cell.fill = filltype
-        s = self.__ws[self.__nextPoint[0]].row
-        b = self.__ws[self.__nextPoint[1]].row
-        for i in range(s,(b+1)):
-            self.__ws.row_dimensions[i].height = height
-        if border_type :
-            self.__setRowBorder(*self.__nextPoint,
-                                left = border_type["left"],
-                                middle = border_type["middle"],
-                                right = border_type["right"])
-        if isinstance(numberformat, dict):
-            self.__setNumberFormat(sformat=numberformat)
-        self.__rowplace = b
+        letters = self.__getColumnsRange()
+        styles = [{"font": fontype, "alignment": aligtype, "fill": filltype} for _ in letters]
+        if numberformat :
+            for i, x in enumerate(numberformat):
+                if x :
+                    styles[i]["number_format"] = x
+        self.__writeBlock(value, styles, border_type=border_type, 
+                          border_per_row=border_per_row, height=height)
     def writeData(self, height:int = 33, col_crossline:int = 0,
                   font_type:dict|None = None, col_font_type:dict|None = None,
                   borde_type:dict|None = None, col_border_type:dict|None = None,
                   numberformat:dict|str|None = None) -> None :
         """
         把数据按照格式要求写入Sheet表格。
+        numberformat - 数据行的数字格式，与 usingData 的 numberformat 合并后在写入时直接设置。
         """
         colmname = [self.__data.columns.to_numpy().tolist()]
         thisdata = self.__data.to_numpy().tolist()
         self.__writeRowData(colmname, font_type = col_font_type,
                             border_type=col_border_type, crossline=col_crossline,
                             height=height)
-        for rri in thisdata :
-            self.__writeRowData([rri], font_type = font_type,
-                            border_type=borde_type, crossline=0,
-                            numberformat=numberformat,
-                            height=height)
+        if not thisdata :
+            return
+        # 所有数据行作为一个区域一次写出，每行单独设置左右边框（与逐行写入的结果相同）。
+        self.__writeRowData(thisdata, font_type = font_type,
+                            border_type=borde_type, crossline=len(thisdata)-1,
+                            numberformat=self.__resolveFormats(numberformat), height=height,
+                            border_per_row=True)
     def writeSummaryData(self, height:int = 33, agg_fun:str = "sum",
                          agg_cols:list[str]|None = None,
                          pass_cols:list[str]|None = None, pass_seq:str = "--",
@@ -266,19 +445,19 @@ class saveExcel(object):
                          borde_type:dict|None = None,
                          numberformat:dict|str|None = None) -> None :
         if font_type :
-            fontype = Font(**font_type["font"]) if "font" in font_type.keys() else Font(name='微软雅黑', 
-                                                                                        size=11.5)
-            sfontype = Font(**font_type["font"]) if "font" in font_type.keys() else Font(name='微软雅黑', 
-                                                                                         size=11.5, 
-                                                                                         bold=True)
-            aligtype = Alignment(**font_type["align"]) if "align" in font_type.keys() else Alignment(horizontal="center",
-                                                                                                     vertical="center")
-            filltype = PatternFill(**font_type["fill"]) if "fill" in font_type.keys() else PatternFill(patternType=None)
+            fontype = STYLE_REGISTRY.font(**font_type["font"]) if "font" in font_type.keys() else STYLE_REGISTRY.font(name='微软雅黑', 
+                                                                                                                      size=11.5)
+            sfontype = STYLE_REGISTRY.font(**font_type["font"]) if "font" in font_type.keys() else STYLE_REGISTRY.font(name='微软雅黑', 
+                                                                                                                       size=11.5, 
+                                                                                                                       bold=True)
+            aligtype = STYLE_REGISTRY.alignment(**font_type["align"]) if "align" in font_type.keys() else STYLE_REGISTRY.alignment(horizontal="center",
+                                                                                                                                   vertical="center")
+            filltype = STYLE_REGISTRY.fill(**font_type["fill"]) if "fill" in font_type.keys() else STYLE_REGISTRY.fill(patternType=None)
         else:
-            fontype = Font(name='微软雅黑', size=11.5)
-            sfontype = Font(name='微软雅黑', size=11.5, bold=True)
-            aligtype = Alignment(horizontal="center",vertical="center")
-            filltype = PatternFill(patternType=None)
+            fontype = STYLE_REGISTRY.font(name='微软雅黑', size=11.5)
+            sfontype = STYLE_REGISTRY.font(name='微软雅黑', size=11.5, bold=True)
+            aligtype = STYLE_REGISTRY.alignment(horizontal="center",vertical="center")
+            filltype = STYLE_REGISTRY.fill(patternType=None)
         self.__make_nextpoint()
         if name_merge_cols:
             stGML = len(name_merge_cols)
@@ -300,6 +479,21 @@ class saveExcel(object):
                 res_data.append(self.__data[i].agg(agg_fun))
             else:
                 res_data.append(self.__data[i].head().iloc[0])
+        formats = self.__resolveFormats(numberformat)
+        if self.__write_only :
+            letters = self.__getColumnsRange()
+            styles = [{} for _ in letters]
+            if stGML > 0 :
+                r0, r1 = self.__pointRows()
+                self.__ws.merged_cells.add("{}:{}{}".format(self.__nextPoint[0],
+                                                            letters[stGML-1], r1))
+                styles[0] = {"font": sfontype, "alignment": aligtype, "fill": filltype}
+            for i in range(stGML, len(letters)):
+                styles[i] = {"font": fontype, "alignment": aligtype, "fill": filltype}
+                if formats[i] :
+                    styles[i]["number_format"] = formats[i]
+            self.__writeBlock([res_data], styles, border_type=borde_type)
+            return
         if stGML > 0 :
             self.__ws.merge_cells("{}:{}{}".format(self.__nextPoint[0],
                                                    get_column_letter(
@@ -315,16 +509,12 @@ class saveExcel(object):
         p = 0
         for cell in itertools.chain(*self.__ws[middlepoint:self.__nextPoint[1]]):
             cell.value = res_data[stGML+p]
-            p += 1
             cell.font = fontype
             cell.alignment = aligtype
             cell.fill = filltype
-            if numberformat:
-                if isinstance(numberformat, dict) :
-                    cLLs = self.__getColumnsRange()
-                    cell.number_format = numberformat[cLLs[stGML+p]]
-                else:
-                    cell.number_format = numberformat
+            if formats[stGML+p] :
+                cell.number_format = formats[stGML+p]
+            p += 1
         if borde_type :
             self.__setRowBorder(*self.__nextPoint,
                                 left = borde_type["left"],
@@ -336,16 +526,18 @@ class saveExcel(object):
                            height:int = 33, 
                            font_type:dict|None = None,
                            border_type:dict|None = None,
-                           numberformat:dict|None = None) -> None :
+                           numberformat:dict|str|None = None) -> None :
+        if self.__write_only :
+            raise ValueError("writeSpecialThings is not supported in write_only mode.")
         if font_type :
-            fontype = Font(**font_type["font"]) if "font" in font_type.keys() else Font(name='微软雅黑', size=11.5)
-            aligtype = Alignment(**font_type["align"]) if "align" in font_type.keys() else Alignment(horizontal="center",
-                                                                                                     vertical="center")
-            filltype = PatternFill(**font_type["fill"]) if "fill" in font_type.keys() else PatternFill(patternType=None)
+            fontype = STYLE_REGISTRY.font(**font_type["font"]) if "font" in font_type.keys() else STYLE_REGISTRY.font(name='微软雅黑', size=11.5)
+            aligtype = STYLE_REGISTRY.alignment(**font_type["align"]) if "align" in font_type.keys() else STYLE_REGISTRY.alignment(horizontal="center",
+                                                                                                                                   vertical="center")
+            filltype = STYLE_REGISTRY.fill(**font_type["fill"]) if "fill" in font_type.keys() else STYLE_REGISTRY.fill(patternType=None)
         else:
-            fontype = Font(name='微软雅黑', size=11.5, bold=True)
-            aligtype = Alignment(horizontal="center",vertical="center")
-            filltype = PatternFill(patternType=None)
+            fontype = STYLE_REGISTRY.font(name='微软雅黑', size=11.5, bold=True)
+            aligtype = STYLE_REGISTRY.alignment(horizontal="center",vertical="center")
+            filltype = STYLE_REGISTRY.fill(patternType=None)
         bordertype = {"left":None,"middle":None,"right":None}
         if border_type :
             bordertype = {**bordertype, **border_type}
@@ -379,12 +571,16 @@ class saveExcel(object):
             self.__ws.row_dimensions[
                 cell_range.CellRange(range_string=giveRange).bounds[1]
             ].height = height
+        if numberformat :
+            self.__setNumberFormat(giveRange, numberformat)
     def setColumnsWidth(self, width:int = 17.5, colname:str|None = None,
                         rangeName:str|None = None) -> None :
         if colname is not None and rangeName is not None :
             raise ValueError("colname and rangeName can not be set at the same time.")
         if self.__data is None :
             raise ValueError("You must add data before you can set the column width.")
+        if self.__write_only and self.__written > 0 :
+            raise ValueError("In write_only mode, column width must be set before writing rows.")
         if colname :
             tmp = self.__columns_to_letter(colname)
             self.__ws.column_dimensions[tmp].width = width
@@ -394,6 +590,85 @@ class saveExcel(object):
             for icol in self.__getColumnsRange():
                 self.__ws.column_dimensions[icol].width = width
 
+_JOB_METHODS = ["actionNewSheet", "switchSheet", "usingData", "writeTitle", "writeData",
+                "writeSummaryData", "writeSpecialThings", "setColumnsWidth"]
+
+def _render_job(job:tuple) -> dict:
+    """
+    按模板生成一个工作簿，返回文件名、工作表数、数据行数、耗时与错误信息。
+    """
+    data, spec = job
+    filename = spec.get("filename")
+    start = time.perf_counter()
+    rows, sheets, error = 0, 0, None
+    try:
+        if not filename :
+            raise ValueError("template spec must give a filename.")
+        wEmodel = saveExcel(filename, startRow=spec.get("startRow", 1),
+                            startColumn=spec.get("startColumn", 1),
+                            write_only=spec.get("write_only", False))
+        steps = spec.get("steps", [])
+        if isinstance(data, (pd.DataFrame, pl.DataFrame)) :
+            if not any(x[0] == "usingData" for x in steps) :
+                wEmodel.usingData(data)
+                rows += data.shape[0]
+        for name, kwargs in steps:
+            if name not in _JOB_METHODS :
+                raise ValueError("unsupported step: {}".format(name))
+            kwargs = dict(kwargs) if kwargs else {}
+            if name == "usingData" :
+                # 多张表时 data 为 {名称: 数据} ，步骤中的 data 给出使用哪一份。
+                key = kwargs.pop("data", None)
+                kwargs["data"] = data[key] if isinstance(data, dict) else data
+                rows += kwargs["data"].shape[0]
+            getattr(wEmodel, name)(**kwargs)
+        sheets = len(wEmodel.sheetnames)
+        wEmodel.save()
+    except Exception as e :
+        error = "{}: {}".format(type(e).__name__, e)
+    return {"filename": str(filename), "sheets": sheets, "rows": rows,
+            "seconds": time.perf_counter() - start, "error": error}
+
+def save_many(jobs:list[tuple], n_workers:int|None = 1,
+              progress:bool|Callable = False) -> pl.DataFrame:
+    """
+    批量生成工作簿。
+    jobs - (data, spec) 列表。data 为 DataFrame ，或多张表时的 {名称: DataFrame} ；
+           spec 为模板：
+           {"filename": 文件名, "startRow": 1, "startColumn": 1, "write_only": False,
+            "steps": [("actionNewSheet", {"sheetname": "结算"}),
+                      ("writeTitle", {"title": "结算表"}),
+                      ("writeData", {...}), ...]}
+           steps 依次调用 saveExcel 的同名方法；没有 usingData 步骤时直接使用 data ，
+           usingData 步骤的 data 参数为 data 字典中的名称。
+    n_workers - 进程数，为1时在当前进程中顺序生成，None 为CPU数。
+    progress - True 时每完成一个文件打印一行进度，也可以给出函数 progress(done, total, result) 。
+    返回每个文件的 filename、sheets、rows、seconds（生成耗时）与 error（成功时为空），
+    顺序与 jobs 相同；单个文件出错不影响其他文件。
+    """
+    total = len(jobs)
+    results = [None] * total
+    def report(done:int, res:dict) -> None:
+        if callable(progress) :
+            progress(done, total, res)
+        elif progress :
+            print("[{}/{}] {} {:.2f}s{}".format(done, total, res["filename"], res["seconds"],
+                                               " ({})".format(res["error"]) if res["error"] else ""))
+    if n_workers == 1 :
+        for i, job in enumerate(jobs):
+            results[i] = _render_job(job)
+            report(i+1, results[i])
+    else :
+        # 与 forecast 相同使用 spawn ，避免 fork 后 polars 线程池死锁。
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {executor.submit(_render_job, job): i for i, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                report(done, results[futures[future]])
+    return pl.DataFrame(results, schema={"filename": pl.Utf8, "sheets": pl.Int64, "rows": pl.Int64,
+                                         "seconds": pl.Float64, "error": pl.Utf8})
+
 
 if __name__ == "__main__":
     """
@@ -25,81 +25,298 @@ import numpy as np
 
 import matplotlib.pyplot as plt
 
-from typing import Self
-from collections.abc import Iterable
-from pytoolsz.frame import szDataFrame
+from typing import Self, Callable
+from collections.abc import Iterable, Iterator
+from pytoolsz.frame import szDataFrame, to_pandas, use_pandas_arrow
 from pytoolsz.utils import isSubset
 
 from pmdarima.model_selection import train_test_split
 
-__all__ = ["tsFrame"]
+__all__ = ["tsCalendar", "tsFrame", "tsPanel", "forecast_errors"]
+
+_OFFSET_UNITS = {"D": (1, "d"), "W": (1, "w"), "MS": (1, "mo"), "ME": (1, "mo"), "M": (1, "mo"),
+                 "QS": (3, "mo"), "QE": (3, "mo"), "Q": (3, "mo"),
+                 "YS": (1, "y"), "YE": (1, "y"), "Y": (1, "y"), "A": (1, "y"), "AS": (1, "y")}
+
+# polars 按 interval 从网格上的起点逐期偏移即可得到与pandas相同日期的频率。
+_EXACT_UNITS = {"D", "W", "MS", "QS", "YS", "AS"}
+# 月末对齐的频率：先按月初生成，再取月末（直接从月末偏移会得到29日、30日等）。
+_END_UNITS = {"ME", "M", "QE", "Q", "YE", "Y", "A"}
+
+# polars 1.21 把 rolling_* 的 min_periods 参数改名为 min_samples 。
+_MIN_SAMPLES = ("min_samples" if tuple(int(x) for x in pl.__version__.split(".")[:2]) >= (1, 21) 
+                else "min_periods")
+
+def _offset_name(freq:str) -> str :
+    return pd.tseries.frequencies.to_offset(freq).name.split("-")[0]
+
+def _to_interval(freq:str|None, step:int|None) -> str|None :
+    """pandas频率字符串转换为polars的时间间隔；无法转换时根据最常见的间隔天数推断。"""
+    if freq is not None :
+        offset = pd.tseries.frequencies.to_offset(freq)
+        name = offset.name.split("-")[0]
+        if name in _OFFSET_UNITS :
+            k, unit = _OFFSET_UNITS[name]
+            return "{}{}".format(k * offset.n, unit)
+    if step is None or step <= 0 :
+        return None
+    if step % 7 == 0 :
+        return "{}w".format(step // 7)
+    if 28 <= step <= 31 :
+        return "1mo"
+    if 89 <= step <= 92 :
+        return "3mo"
+    if 365 <= step <= 366 :
+        return "1y"
+    return "{}d".format(step)
+
+def _to_freq(interval:str, start) -> str :
+    """polars时间间隔转换为pandas频率字符串。"""
+    k, unit = int(interval.rstrip("dwmoy")), interval.lstrip("0123456789")
+    match unit :
+        case "d" :
+            return "{}D".format(k)
+        case "w" :
+            return "{}W-{}".format(k, pd.Timestamp(start).day_name()[:3].upper())
+        case "mo" :
+            return "{}MS".format(k) if pd.Timestamp(start).day == 1 else "{}ME".format(k)
+        case _ :
+            return "{}YS".format(k) if pd.Timestamp(start).dayofyear == 1 else "{}YE".format(k)
+
+def _scale_interval(interval:str, n:int) -> str :
+    k, unit = int(interval.rstrip("dwmoy")), interval.lstrip("0123456789")
+    return "{}{}".format(k * n, unit)
+
+class tsCalendar(object):
+    """
+    时间序列的日历索引，在 tsFrame 创建时计算一次，之后生成未来日期、填补缺口都直接使用。
+    freq - pandas频率字符串（存在缺口时根据最常见间隔推断）。
+    interval - 对应的polars时间间隔，如 "1d"、"1w"、"1mo" 。
+               工作日（B）等polars没有对应间隔的频率，interval 只是近似值，
+               日期网格与未来日期改用 pandas.date_range 按 freq 生成。
+    start/end - 最早/最晚日期。
+    n_obs/n_expected - 实际行数/按频率应有的行数。
+    regular - 是否完全规则（没有缺口，且都落在频率网格上）。
+    gaps - 缺口表：start、end（缺失的第一天与最后一天）、missing（缺失期数）。
+    """
+    def __init__(self, dates:pl.Series) -> None:
+        dates = dates.drop_nulls()
+        self.start = dates.min()
+        self.end = dates.max()
+        self.n_obs = dates.len()
+        freq = None
+        if self.n_obs >= 3 :
+            try :
+                freq = pd.infer_freq(dates.to_pandas())
+            except (ValueError, TypeError) :
+                freq = None
+        steps = dates.diff().drop_nulls().dt.total_days()
+        step = int(steps.mode().min()) if steps.len() else None
+        if (freq is None and step == 1 and dates.dt.weekday().max() <= 5 and 
+            (self.end - self.start).days >= 7) :
+            # 有缺口的工作日序列 pandas 无法推断频率，跨过周末却没有周末日期时按工作日处理。
+            freq = "B"
+        self.interval = _to_interval(freq, step)
+        self.freq = freq if freq is not None or self.interval is None else _to_freq(self.interval, self.start)
+        self.__dtype = dates.dtype
+        self.__mode = None
+        if self.interval is not None :
+            name = _offset_name(self.freq)
+            self.__mode = ("polars" if name in _EXACT_UNITS else 
+                           "month_end" if name in _END_UNITS else "pandas")
+        if self.interval is None :
+            self.n_expected = self.n_obs
+            self.regular = self.n_obs <= 1
+            self.gaps = pl.DataFrame(schema={"start": dates.dtype, "end": dates.dtype, "missing": pl.UInt32})
+            return
+        grid = self.grid().alias("date")
+        missing = grid.to_frame().with_row_index("pos").filter(~pl.col("date").is_in(dates.implode()))
+        self.n_expected = grid.len()
+        self.regular = missing.height == 0 and dates.n_unique() == grid.len()
+        self.gaps = missing.group_by((pl.col("pos").diff().fill_null(1) != 1).cum_sum().alias("run"),
+                                     maintain_order=True).agg(
+            pl.col("date").first().alias("start"),
+            pl.col("date").last().alias("end"),
+            pl.len().cast(pl.UInt32).alias("missing")).drop("run")
+    def __repr__(self) -> str:
+        return "tsCalendar(freq={}, interval={}, {} ~ {}, n_obs={}, n_expected={}, regular={}, gaps={})".format(
+            self.freq, self.interval, self.start, self.end, self.n_obs, self.n_expected,
+            self.regular, self.gaps.height)
+    def grid(self, start = None, end = None) -> pl.Series :
+        """start 到 end （默认为序列的起止日期）之间按频率应有的全部日期。"""
+        if self.interval is None :
+            raise ValueError("Cannot infer the frequency of this series.")
+        start = self.start if start is None else start
+        end = self.end if end is None else end
+        match self.__mode :
+            case "polars" :
+                return pl.date_range(start, end, self.interval, eager=True)
+            case "month_end" :
+                ms, me = pl.select(pl.lit(start).dt.month_start().alias("s"),
+                                   pl.lit(end).dt.month_start().alias("e")).row(0)
+                return pl.date_range(ms, me, self.interval, eager=True).dt.month_end()
+            case _ :
+                dates = pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq=self.freq)
+                return pl.Series("date", dates.to_numpy()).cast(self.__dtype)
+    def future(self, n_periods:int, name:str = "ds") -> pl.Series :
+        """最后一个日期之后的 n_periods 个日期。"""
+        if self.interval is None :
+            raise ValueError("Cannot infer the frequency of this series.")
+        if self.__mode == "pandas" :
+            dates = pd.date_range(pd.Timestamp(self.end), periods=n_periods+1, freq=self.freq)
+            dates = dates[dates > pd.Timestamp(self.end)][:n_periods]
+            return pl.Series(name, dates.to_numpy()).cast(self.__dtype)
+        end = pl.select(pl.lit(self.end).dt.offset_by(_scale_interval(self.interval, n_periods))).item()
+        return self.grid(self.end, end).slice(1, n_periods).alias(name)
+
+def forecast_errors(actual:np.ndarray, pred:np.ndarray, 
+                    scale:np.ndarray|None = None) -> dict[str, np.ndarray] :
+    """
+    向量化计算预测误差，actual/pred 为 (折数, 预测期数) 的矩阵，缺失值用NaN表示。
+    scale - 每折的MASE分母（训练集上季节性naive预测的平均绝对误差），为None时不计算MASE。
+    返回每折的 mape、smape、mase 。
+    """
+    actual = np.atleast_2d(np.asarray(actual, dtype=np.float64))
+    pred = np.atleast_2d(np.asarray(pred, dtype=np.float64))
+    err = np.abs(actual - pred)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        res = {
+            "mape": np.nanmean(np.where(actual != 0, err / np.abs(actual), np.nan), axis=1),
+            "smape": np.nanmean(2 * err / (np.abs(actual) + np.abs(pred)), axis=1),
+        }
+        if scale is not None :
+            res["mase"] = np.nanmean(err, axis=1) / np.asarray(scale, dtype=np.float64)
+    return res
 
 class tsFrame(object):
     def __init__(self, data:pl.DataFrame|pd.DataFrame|szDataFrame,
                  dt:str|Iterable, variable:str, 
                  covariates:str|Iterable[str]|None = None) -> None:
-        self.__data = data if isinstance(data, szDataFrame) else szDataFrame(from_data=data)
-        self.__data = self.__data.to_polars()
+        self.__data = data if isinstance(data, szDataFrame) else szDataFrame(None, from_data=data)
+        self.__data = self.__data.get()
+        self.__pandas = {}
+        self.__exports = {}
+        self.__exports_of = None
         if dt in self.__data.columns:
             self.__dt = dt
-            self.__data = self.__data.with_column(pl.col(dt).cast(pl.Date)).sort(self.__dt)
+            self.__data = self.__data.with_columns(pl.col(dt).cast(pl.Date)).sort(self.__dt)
         else:
             raise ValueError(f"{dt} is not a column in data")
         if variable in self.__data.columns:
             self.__y = variable
         else:
             raise ValueError(f"{variable} is not a column in data")
+        self.__calendar = tsCalendar(self.__data[self.__dt])
         if isinstance(covariates, str) :
             if covariates in self.__data.columns :
                 self.__variables = [covariates]
             else :
                 raise ValueError(f"{covariates} is not a column in data")
-        elif isSubset(self.__data.columns, covariates) :
-            self.__variables = covariates
         elif covariates is None :
             self.__variables = None
+        elif isSubset(self.__data.columns, covariates) :
+            self.__variables = covariates
         else :
             raise ValueError(f"{covariates} is not a subset of data-columns")
-    def for_prophet(self, cap:str|Iterable|float|None = None, 
-                    floor:str|Iterable|float|None = None) -> pd.DataFrame :
-        if cap is None and floor is None :
-            res = self.__data.select([self.__dt, self.__y]).to_pandas()
-            res.columns = ["ds","y"]
-        if cap is not None and floor is None :
-            if isinstance(cap, str) :
-                res = self.__data.select([self.__dt, self.__y, cap]).to_pandas()
-                res.columns = ["ds","y","cap"]
-            else :
-                res = self.__data.select([self.__dt, self.__y]).to_pandas()
-                res["cap"] = cap
-        if cap is not None and floor is not None :
-            if isinstance(cap, str) and isinstance(floor, str) :
-                res = self.__data.select([self.__dt, self.__y, cap, floor]).to_pandas()
-                res.columns = ["ds","y","cap","floor"]
-            else :
-                res = self.__data.select([self.__dt, self.__y]).to_pandas()
-                res["cap"] = cap
-                res["floor"] = floor
+    def __export(self, key:tuple, builder:Callable) -> object :
+        # 导出结果按参数缓存，底层数据对象被替换后全部失效。
+        if self.__exports_of is not self.__data :
+            self.__exports = {}
+            self.__exports_of = self.__data
+        if key not in self.__exports :
+            value, zero_copy = builder()
+            self.__exports[key] = [value, zero_copy, 0]
+        self.__exports[key][2] += 1
+        return self.__exports[key][0]
+    @staticmethod
+    def __readonly_array(data:pl.Series|pl.DataFrame) -> tuple[np.ndarray, bool] :
+        # 只读的float64数组；Float64、无空值且单块的列可以直接共享Polars内存。
+        dtypes = [data.dtype] if isinstance(data, pl.Series) else data.dtypes
+        data = data.cast(pl.Float64)
+        try :
+            res = data.to_numpy(allow_copy=False)
+            zero_copy = all(x == pl.Float64 for x in dtypes)
+        except (RuntimeError, ValueError) :
+            res, zero_copy = np.ascontiguousarray(data.to_numpy(), dtype=np.float64), False
+        res.flags.writeable = False
+        return res, zero_copy
+    def __build_prophet(self, cap:str|Iterable|float|None = None, 
+                        floor:str|Iterable|float|None = None) -> pd.DataFrame :
         if cap is None and floor is not None :
             raise ValueError("floor must be None when cap is not None")
+        cols = [pl.col(self.__dt).alias("ds"), pl.col(self.__y).alias("y")]
+        cols += [pl.col(cap).alias("cap")] if isinstance(cap, str) else []
+        cols += [pl.col(floor).alias("floor")] if isinstance(floor, str) else []
+        res = self.__data.select(cols).to_pandas()
+        if cap is not None and not isinstance(cap, str) :
+            res["cap"] = cap
+        if floor is not None and not isinstance(floor, str) :
+            res["floor"] = floor
         return res
+    def for_prophet(self, cap:str|Iterable|float|None = None, 
+                    floor:str|Iterable|float|None = None) -> pd.DataFrame :
+        """
+        Prophet所需的数据框（ds、y、cap、floor）。
+        cap/floor 为列名或数值时结果会被缓存，重复调用不再转换。
+        返回的是浅拷贝：增删、重命名列不会影响缓存，但各列与缓存共享数据，
+        不要原地修改其中的值（如 res["y"].values[:] = ...），需要时请自行 copy() 。
+        """
+        try :
+            key = ("prophet", cap, floor)
+            hash(key)
+        except TypeError :
+            return self.__build_prophet(cap, floor)
+        res = self.__export(key, lambda: (self.__build_prophet(cap, floor), False))
+        return res.copy(deep=False)
     def for_auto_arima(self) -> np.ndarray|tuple[np.ndarray] :
+        """
+        返回 (y, X) ，均为只读、连续的float64数组，只在第一次调用时生成。
+        y 为Float64且没有空值时直接共享Polars的内存，不复制。
+        """
+        yres = self.__export(("y",), lambda: tsFrame.__readonly_array(self.__data[self.__y]))
         if self.__variables :
-            Xres = self.__data.select(pl.col(self.__variables)).to_numpy()
-            return self.__data[self.__y].to_numpy(), Xres
+            Xres = self.__export(("X",), lambda: tsFrame.__readonly_array(
+                self.__data.select(pl.col(self.__variables))))
+            return yres, Xres
         else:
-            return self.__data[self.__y].to_numpy(), None
+            return yres, None
+    def export_report(self) -> pl.DataFrame :
+        """
+        导出缓存的内存报告：每个导出一行，
+        bytes 为导出占用的字节数，zero_copy 表示是否与Polars共享内存，calls 为调用次数，
+        saved_bytes 为相比每次调用都复制一次所节省的字节数。
+        """
+        rows = []
+        for key, (value, zero_copy, calls) in self.__exports.items():
+            if isinstance(value, pd.DataFrame) :
+                size = int(value.memory_usage(deep=True).sum())
+            else :
+                size = int(value.nbytes)
+            rows.append({"export": ":".join(str(x) for x in key), "bytes": size,
+                         "zero_copy": zero_copy, "calls": calls,
+                         "saved_bytes": size * (calls if zero_copy else calls - 1)})
+        return pl.DataFrame(rows, schema={"export": pl.Utf8, "bytes": pl.Int64, 
+                                          "zero_copy": pl.Boolean, "calls": pl.Int64,
+                                          "saved_bytes": pl.Int64})
+    @property
+    def calendar(self) -> tsCalendar :
+        return self.__calendar
     def getFreq(self) -> str :
-        res = pd.infer_freq(self.__data[self.__dt].to_pandas())
-        return res
+        return self.__calendar.freq
     def make_future_dataframe(self, n_periods:int = 10, 
                               include_history:bool = False,
                               frequency:str|None = None,
                               keep_name:str|bool = False) -> pd.DataFrame :
-        if frequency is None:
-            freq = self.getFreq()
+        if keep_name :
+            xname = self.__dt if isinstance(keep_name, bool) else keep_name
         else :
-            freq = frequency
+            xname = "ds"
+        if frequency is None and self.__calendar.interval is not None :
+            dates = self.__calendar.future(n_periods, xname).cast(pl.Datetime("ns"))
+            if include_history :
+                dates = pl.concat([self.__data[self.__dt].cast(pl.Datetime("ns")).alias(xname), dates])
+            return dates.to_frame().to_pandas()
+        freq = self.getFreq() if frequency is None else frequency
         last_date = self.__data[self.__dt].max()
         dates = pd.date_range(
             start=last_date,
@@ -109,19 +326,49 @@ class tsFrame(object):
         dates = dates[:n_periods]
         if include_history:
             dates = np.concatenate((np.array(self.__data[self.__dt].to_list()), dates))
-        if keep_name :
-            xname = self.__dt if isinstance(keep_name, bool) else keep_name
-        else :
-            xname = "ds"
         return pd.DataFrame({xname: dates})
+    def upsample(self, fill:str|None = "null", interval:str|None = None) -> Self :
+        """
+        按频率补齐缺失的日期（Polars向量化实现），返回新的 tsFrame 。
+        fill - 缺失值填充方式："null"（保留空值）、"forward"、"backward"、"zero"、"interpolate" 。
+        interval - polars时间间隔，如 "1d"、"1mo"，默认使用日历索引推断的间隔。
+        """
+        if interval is None and self.__calendar.interval is None :
+            raise ValueError("Cannot infer the frequency of this series, please give interval.")
+        if self.__calendar.regular and interval in (None, self.__calendar.interval) :
+            return self
+        values = [self.__y] + (self.__variables if self.__variables else [])
+        if interval is None :
+            # 使用日历索引的日期网格，月末、工作日等频率也能正确补齐。
+            res = (self.__calendar.grid().alias(self.__dt).to_frame()
+                   .join(self.__data, on=self.__dt, how="left").sort(self.__dt))
+        else :
+            res = self.__data.upsample(time_column=self.__dt, every=interval, maintain_order=True)
+        match fill :
+            case "null" | None :
+                pass
+            case "forward" | "backward" | "zero" :
+                res = res.with_columns(pl.col(values).fill_null(strategy=fill))
+            case "interpolate" :
+                res = res.with_columns(pl.col(values).interpolate())
+            case _ :
+                raise ValueError("fill must be one of null/forward/backward/zero/interpolate.")
+        return tsFrame(res, self.__dt, self.__y, self.__variables)
     def plot(self, to_show:bool = True) -> None :
         self.__data.plot(x=self.__dt, y=self.__y)
         if to_show :
             plt.show()
     def to_polars(self) -> pl.DataFrame :
         return self.__data
-    def to_pandas(self) -> pd.DataFrame :
-        return self.__data.to_pandas()
+    def to_pandas(self, arrow:bool|None = None) -> pd.DataFrame :
+        """
+        转换为pandas，每种转换方式只转换一次，返回的是共享对象。
+        arrow - 是否使用Arrow扩展类型，None时使用 frame.set_pandas_arrow 的默认设置。
+        """
+        key = use_pandas_arrow(arrow)
+        if key not in self.__pandas :
+            self.__pandas[key] = to_pandas(self.__data, arrow=arrow)
+        return self.__pandas[key]
     def __repr__(self) -> str :
         if self.__variables :
             return f"tsFrame(\n\tdata{self.__data.shape}, \n\tdt={self.__dt}, \n\ty={self.__y}, \n\tvariables={self.__variables}\n)"
@@ -133,4 +380,235 @@ class tsFrame(object):
         trainp = tsFrame(trainp, self.__dt, self.__y, self.__variables)
         testp = tsFrame(testp, self.__dt, self.__y, self.__variables)
         return trainp, testp
-        
\ No newline at end of file
+    def folds(self, horizon:int, n_folds:int = 3, step:int|None = None,
+              window:str = "expanding", 
+              train_size:int|None = None) -> list[tuple[np.ndarray, np.ndarray]] :
+        """
+        滚动原点回测的折划分，返回每折的 (训练集行号, 测试集行号) ，按时间从早到晚排列。
+        只生成行号，不复制数据；配合 iter_folds 使用Polars切片读取数据。
+        horizon - 每折的预测期数（测试集长度）。
+        n_folds - 折数，最后一折的测试集为数据的最后 horizon 行。
+        step - 相邻两折的预测起点间隔，默认等于 horizon 。
+        window - "expanding"（训练集从第一行开始）或 "rolling"（训练集长度固定为 train_size）。
+        train_size - rolling 时的训练集长度；expanding 时为最短训练集长度。
+        """
+        if window not in ["expanding", "rolling"] :
+            raise ValueError("window must be 'expanding' or 'rolling'.")
+        if window == "rolling" and train_size is None :
+            raise ValueError("train_size must be provided when window is 'rolling'.")
+        step = horizon if step is None else step
+        nrow = self.__data.height
+        first = nrow - horizon - (n_folds - 1) * step
+        if first < (train_size if train_size else 2) :
+            raise ValueError("Not enough data for {} folds of horizon {}.".format(n_folds, horizon))
+        res = []
+        for i in range(n_folds):
+            start = first + i * step
+            begin = start - train_size if window == "rolling" else 0
+            res.append((np.arange(begin, start), np.arange(start, start + horizon)))
+        return res
+    def iter_folds(self, horizon:int, n_folds:int = 3, step:int|None = None,
+                   window:str = "expanding", 
+                   train_size:int|None = None) -> Iterator[tuple[pl.DataFrame, pl.DataFrame]] :
+        """按 folds 的划分逐折返回 (训练集, 测试集) ，均为零拷贝的Polars切片。"""
+        for train, test in self.folds(horizon, n_folds, step, window, train_size):
+            yield (self.__data.slice(train[0], len(train)),
+                   self.__data.slice(test[0], len(test)))
+    def __mase_scale(self, folds:list[tuple[np.ndarray, np.ndarray]], m:int) -> np.ndarray :
+        # 训练集上季节性naive预测的平均绝对误差，用累积和一次算出所有折。
+        values = self.__data[self.__y].to_numpy().astype(np.float64)
+        csum = np.concatenate([[0.0], np.cumsum(np.abs(values[m:] - values[:-m]))])
+        begin = np.array([x[0][0] for x in folds])
+        end = np.array([x[0][-1] + 1 for x in folds])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (csum[end - m] - csum[begin]) / (end - begin - m)
+    def backtest(self, model:str|Callable = "arima", horizon:int = 10, 
+                 n_folds:int = 3, step:int|None = None,
+                 window:str = "expanding", train_size:int|None = None,
+                 m:int = 1, n_workers:int|None = None,
+                 **kwargs) -> tuple[pl.DataFrame, pl.DataFrame] :
+        """
+        滚动原点回测。每折在进程池中独立拟合预测，误差指标对所有折一次性向量化计算。
+        model - "arima"（quickARIMA）、"prophet"（quickProphet）或可被pickle的函数，
+                与 forecast.forecast_many 的 model 参数相同。
+        horizon/n_folds/step/window/train_size - 折的划分，见 folds 。
+        m - MASE使用的季节周期，1为naive预测。
+        n_workers - 进程数，默认为CPU核数；为1时在当前进程中顺序执行。
+        **kwargs - 传给模型函数的参数（如 orders）。
+        返回：
+        metrics - 每折一行：fold、train_start、train_end、test_end、mape、smape、mase、status、error 。
+        forecasts - 每折每期一行：fold、dt、y（实际值）、{y}_pred、{y}_upper、{y}_lower 。
+        """
+        from pytoolsz.forecast import _run_tasks
+        folds = self.folds(horizon, n_folds, step, window, train_size)
+        if model == "arima" :
+            # 回测的每一折都不是真实的增量更新，不使用模型存储；各折的训练数据不同，
+            # 也不读写全局的参数缓存，避免不同序列、不同回测之间互相影响。
+            kwargs.setdefault("model_store", False)
+            kwargs.setdefault("order_cache", False)
+        # 折序号不能作为序列标识。
+        kwargs.pop("namespace", None)
+        cols = [self.__dt, self.__y] + (self.__variables if self.__variables else [])
+        data = self.__data.select(cols)
+        tasks = []
+        for i, (train, test) in enumerate(folds):
+            future_exog = (data.slice(test[0], len(test)).select(self.__variables)
+                           if self.__variables else None)
+            tasks.append((i, data.slice(train[0], len(train)), model, "fold", self.__dt, 
+                          self.__y, horizon, self.__variables, future_exog, kwargs))
+        results = _run_tasks(tasks, n_workers)
+        pname = f"{self.__y}_pred"
+        actual = np.stack([data[self.__y].to_numpy()[test].astype(np.float64) for _, test in folds])
+        pred = np.full(actual.shape, np.nan)
+        forecasts = []
+        for i, (res, (_, test)) in enumerate(zip(results, folds)):
+            if res["status"][0] != "ok" :
+                continue
+            pred[i, :min(horizon, res.height)] = res[pname].to_numpy()[:horizon]
+            forecasts.append(data.slice(test[0], len(test)).select(self.__dt, self.__y)
+                             .with_columns(pl.lit(i, dtype=pl.Int64).alias("fold"))
+                             .hstack(res.head(horizon).select(pl.all().exclude(
+                                 "fold", self.__dt, "status", "error"))))
+        scores = forecast_errors(actual, pred, self.__mase_scale(folds, m))
+        metrics = pl.DataFrame({
+            "fold": list(range(len(folds))),
+            "train_start": [int(x[0][0]) for x in folds],
+            "train_end": [int(x[0][-1]) + 1 for x in folds],
+            "test_end": [int(x[1][-1]) + 1 for x in folds],
+            **scores,
+            "status": [x["status"][0] for x in results],
+            "error": pl.Series([x["error"][0] for x in results], dtype=pl.Utf8),
+        })
+        forecasts = (pl.concat(forecasts, how="diagonal_relaxed").select("fold", pl.all().exclude("fold"))
+                     if forecasts else pl.DataFrame())
+        return metrics, forecasts
+        
+class tsPanel(object):
+    """
+    多序列（面板）时间序列数据框。
+    所有序列保存在一个按 (id, dt) 排序的长格式 Polars 数据框中，
+    并用偏移量索引（每条序列的起始行与行数）直接切片访问单条序列，不复制数据。
+    """
+    def __init__(self, data:pl.DataFrame|pd.DataFrame|szDataFrame,
+                 id_col:str, dt:str, variable:str, 
+                 covariates:str|Iterable[str]|None = None) -> None:
+        data = data if isinstance(data, szDataFrame) else szDataFrame(None, from_data=data)
+        data = data.get()
+        for col in [id_col, dt, variable] :
+            if col not in data.columns :
+                raise ValueError(f"{col} is not a column in data")
+        if isinstance(covariates, str) :
+            covariates = [covariates]
+        if covariates is not None and not isSubset(data.columns, covariates) :
+            raise ValueError(f"{covariates} is not a subset of data-columns")
+        self.__id = id_col
+        self.__dt = dt
+        self.__y = variable
+        self.__variables = list(covariates) if covariates else None
+        self.__set_data(data.with_columns(pl.col(dt).cast(pl.Date)).sort(id_col, dt).rechunk())
+    def __set_data(self, data:pl.DataFrame) -> None:
+        # data 必须已按 (id, dt) 排序。
+        self.__data = data
+        self.__index = (data.select(self.__id).with_row_index("offset")
+                        .group_by(self.__id, maintain_order=True)
+                        .agg(pl.col("offset").first(), pl.len().alias("length")))
+        self.__offsets = {k: (o, n) for k, o, n in self.__index.iter_rows()}
+    def __derive(self, data:pl.DataFrame) -> Self :
+        # 在不改变行顺序的前提下生成新的面板，跳过排序。
+        res = object.__new__(tsPanel)
+        res.__id, res.__dt, res.__y, res.__variables = self.__id, self.__dt, self.__y, self.__variables
+        res.__data = data
+        res.__index = self.__index
+        res.__offsets = self.__offsets
+        return res
+    def __len__(self) -> int :
+        return len(self.__offsets)
+    def __contains__(self, key) -> bool :
+        return key in self.__offsets
+    def __repr__(self) -> str :
+        return f"tsPanel(\n\tdata{self.__data.shape}, \n\tseries={len(self)}, \n\tid={self.__id}, \n\tdt={self.__dt}, \n\ty={self.__y}, \n\tvariables={self.__variables}\n)"
+    @property
+    def id_col(self) -> str :
+        return self.__id
+    @property
+    def dt(self) -> str :
+        return self.__dt
+    @property
+    def variable(self) -> str :
+        return self.__y
+    @property
+    def ids(self) -> list :
+        return list(self.__offsets.keys())
+    @property
+    def index(self) -> pl.DataFrame :
+        """偏移量索引：id、offset（起始行）、length（行数）。"""
+        return self.__index
+    def to_polars(self) -> pl.DataFrame :
+        return self.__data
+    def series(self, key) -> pl.DataFrame :
+        """单条序列，零拷贝切片。"""
+        if key not in self.__offsets :
+            raise ValueError(f"{key} is not in this panel")
+        offset, length = self.__offsets[key]
+        return self.__data.slice(offset, length)
+    def __getitem__(self, key) -> pl.DataFrame :
+        return self.series(key)
+    def to_tsFrame(self, key) -> tsFrame :
+        return tsFrame(self.series(key), self.__dt, self.__y, self.__variables)
+    def with_columns(self, *exprs:pl.Expr) -> Self :
+        """按序列分组（over(id)）计算新列，例如 `panel.with_columns(pl.col("y").cum_sum())` 。"""
+        return self.__derive(self.__data.with_columns([x.over(self.__id) for x in exprs]))
+    def __values(self, columns:str|list[str]|None) -> list[str] :
+        if columns is None :
+            return [self.__y]
+        return [columns] if isinstance(columns, str) else list(columns)
+    def lag(self, n:int = 1, columns:str|list[str]|None = None) -> Self :
+        """分组滞后，新列名为 {列名}_lag{n} 。"""
+        return self.with_columns(*[pl.col(x).shift(n).alias(f"{x}_lag{n}") 
+                                   for x in self.__values(columns)])
+    def diff(self, n:int = 1, columns:str|list[str]|None = None) -> Self :
+        """分组差分，新列名为 {列名}_diff{n} 。"""
+        return self.with_columns(*[pl.col(x).diff(n).alias(f"{x}_diff{n}") 
+                                   for x in self.__values(columns)])
+    def rolling(self, window:int, stats:str|list[str] = "mean", 
+                columns:str|list[str]|None = None, min_samples:int|None = None) -> Self :
+        """
+        分组滚动统计，新列名为 {列名}_{统计量}{window} 。
+        stats - mean、std、var、sum、min、max、median 中的一个或多个。
+        """
+        stats = [stats] if isinstance(stats, str) else stats
+        exprs = []
+        for x in self.__values(columns) :
+            for stat in stats :
+                if stat not in ["mean", "std", "var", "sum", "min", "max", "median"] :
+                    raise ValueError(f"Unsupported rolling stat: {stat}")
+                func = getattr(pl.col(x), f"rolling_{stat}")
+                opts = {} if min_samples is None else {_MIN_SAMPLES: min_samples}
+                exprs.append(func(window, **opts).alias(f"{x}_{stat}{window}"))
+        return self.with_columns(*exprs)
+    def iter_batches(self, n_series:int = 100) -> Iterator[pl.DataFrame] :
+        """每次返回连续 n_series 条序列组成的零拷贝切片。"""
+        index = self.__index
+        for i in range(0, index.height, n_series):
+            part = index.slice(i, n_series)
+            offset = part["offset"][0]
+            yield self.__data.slice(offset, int(part["length"].sum()))
+    def forecast(self, model:str|Callable = "arima", n_periods:int = 10,
+                 future_exog:pl.DataFrame|None = None,
+                 n_workers:int|None = None, chunksize:int = 1, **kwargs) -> pl.DataFrame :
+        """
+        对所有序列批量预测，与 forecast.forecast_many 相同，但直接使用偏移量切片生成任务，
+        不再重新排序、拆分数据。
+        future_exog - 未来外生变量，长格式，需包含 id 列。
+        """
+        from pytoolsz.forecast import FORECASTERS, _run_tasks
+        if isinstance(model, str) and model not in FORECASTERS :
+            raise ValueError("model must be one of {} or a callable.".format(list(FORECASTERS.keys())))
+        cols = [self.__id, self.__dt, self.__y] + (self.__variables if self.__variables else [])
+        data = self.__data.select(cols)
+        fexogs = {} if future_exog is None else future_exog.partition_by(self.__id, as_dict=True)
+        tasks = [(key, data.slice(offset, length), model, self.__id, self.__dt, self.__y, 
+                  n_periods, self.__variables, fexogs.get((key,)), kwargs)
+                 for key, (offset, length) in self.__offsets.items()]
+        res = pl.concat(_run_tasks(tasks, n_workers, chunksize), how="diagonal_relaxed")
+        return res.select(self.__id, pl.all().exclude(self.__id))
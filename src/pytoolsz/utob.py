@@ -16,7 +16,7 @@
 # See the Mulan PSL v2 for more details.
 
 from pathlib import Path
-from pytoolsz.frame import szDataFrame,zipreader,optExpr
+from pytoolsz.frame import szDataFrame,zipreader,zipColumns,optExpr,to_pandas
 from pytoolsz.pretools import (
     quick_date,
     get_interval_dates, 
@@ -236,12 +236,11 @@ def read_YouTube_zipdata(tarName:str, between_date:list[str], channelName:str,
     filelike = "{} {}_{} {}{}.zip".format(tarName,*between_date,channelName,plus_str)
     csvlike = "{}{}.csv".format(dataName,COMPARENAME if compare else "")
     homepath = Path(rootpath) if rootpath else Path(".").absolute()
-    data = zipreader(homepath/filelike, csvlike)
+    optrans = None
     if transType is not None :
-        optrans = optExpr(transType, data)
-        if optrans is not None:
-            data = zipreader(homepath/filelike, csvlike, transtype = optrans)
-    return data
+        # 列名来自 ARCHIVE_CACHE 中缓存的列结构，不需要重复读取数据。
+        optrans = optExpr(transType, zipColumns(homepath/filelike, csvlike))
+    return zipreader(homepath/filelike, csvlike, transtype = optrans)
 
 def read_multiChannel(tarName:str, between_date:list[str], channelNames:list[str],
                       dataName:str, lastnum:bool|int = False,
@@ -282,7 +281,7 @@ def read_multiChannel(tarName:str, between_date:list[str], channelNames:list[str
                     data = data.group_by(key).agg(value)
     else :
         data = pl.concat(data)
-    return data if convert == "polars" else data.to_pandas()
+    return data if convert == "polars" else to_pandas(data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+import datetime
+import json
+import logging
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from pytoolsz.forecast import (_diff_order, _quiet_stan, auto_orders, batch_diagnostics, 
+                               fitMemo, modelStore, orderCache, prophet_init, quickProphet)
+
+def _series_with_gap() -> np.ndarray:
+    rng = np.random.default_rng(5)
+    values = np.cumsum(rng.normal(0, 1, 200)) + 50
+    values[[40, 41, 120]] = np.nan
+    return values
+
+def test_diff_order_skips_missing_values():
+    values = _series_with_gap()
+    d, stat, pvalue = _diff_order(values, 5)
+    assert d >= 1
+    assert np.isfinite(stat) and np.isfinite(pvalue)
+
+def test_batch_diagnostics_with_gap():
+    res = batch_diagnostics({"gap": _series_with_gap()}, diff_max=5)
+    row = res.row(0, named=True)
+    assert row["error"] is None
+    assert row["d"] >= 1
+    assert np.isfinite(row["adf_pvalue"]) and np.isfinite(row["kpss_pvalue"])
+
+def test_batch_diagnostics_reports_insufficient_series():
+    res = batch_diagnostics({"empty": np.array([]), "null": np.full(30, np.nan),
+                             "short": np.arange(3.0)}, diff_max=5)
+    for row in res.iter_rows(named=True):
+        assert row["error"].startswith("insufficient data")
+        assert row["d"] is None and row["adf_pvalue"] is None and row["kpss_pvalue"] is None
+        assert row["season"] == 0
+
+_ORDERS = ((1, 1, 1), (0, 0, 0, 0), "c")
+
+def test_model_store_hit_append_and_changed_history():
+    values = np.arange(50, dtype=np.float64)
+    with TemporaryDirectory() as tmp:
+        store = modelStore(tmp)
+        assert store.lookup("s", _ORDERS, None, values, ["a", "b"]) == (None, True)
+        store.store("s", _ORDERS, None, values, ["a", "b"], np.array([0.5, 1.0]))
+        params, estimate = store.lookup("s", _ORDERS, None, np.append(values, 50.0), ["a", "b"])
+        assert params.tolist() == [0.5, 1.0] and not estimate
+        changed = values.copy()
+        changed[0] = -1.0
+        assert store.lookup("s", _ORDERS, None, changed, ["a", "b"]) == (None, True)
+        assert store.lookup("s", _ORDERS, ["x"], values, ["a", "b"]) == (None, True)
+        assert (store.hits, store.misses) == (1, 3)
+
+def test_model_store_ttl_counts_from_fit_not_hits():
+    values = np.arange(50, dtype=np.float64)
+    with TemporaryDirectory() as tmp:
+        store = modelStore(tmp, ttl=60)
+        store.store("s", _ORDERS, None, values, ["a"], np.array([0.5]))
+        rec = store.read("s", _ORDERS)
+        rec["created"] = time.time() - 120
+        store.entry("s", _ORDERS).write_text(json.dumps(rec), encoding="utf-8")
+        params, estimate = store.lookup("s", _ORDERS, None, values, ["a"])
+        assert params.tolist() == [0.5] and estimate
+        assert store.warm_starts == 1
+
+def test_model_store_and_order_cache_keys_are_separate():
+    with TemporaryDirectory() as tmp:
+        store, cache = modelStore(tmp), orderCache(tmp)
+        store.store("s", _ORDERS, None, np.arange(10.0), ["a"], np.array([0.5]))
+        cache.store("s", 0, "fp", _ORDERS)
+        assert (len(store), len(cache)) == (1, 1)
+        assert store.read("s", _ORDERS)["params"] == [0.5]
+        assert cache.read("s", 0)["fingerprint"] == "fp"
+
+def test_fit_memo_is_lru():
+    memo = fitMemo(maxsize=2)
+    memo.set(("a",), 1)
+    memo.set(("b",), 2)
+    assert memo.get(("a",)) == 1
+    memo.set(("c",), 3)
+    assert ("b",) not in memo and ("a",) in memo and ("c",) in memo
+    assert memo.get(("b",), "missing") == "missing"
+    assert (memo.hits, memo.misses) == (1, 1)
+
+def test_auto_orders_reuses_memo():
+    rng = np.random.default_rng(3)
+    data = pd.Series(np.cumsum(rng.normal(size=48)) + 20)
+    memo = fitMemo()
+    first = auto_orders(data, diff_max=4, memo=memo)
+    size, hits = len(memo), memo.hits
+    assert auto_orders(data, diff_max=4, memo=memo) == first
+    assert (len(memo), memo.hits) == (size, hits + 1)
+    assert auto_orders(data, diff_max=4, memo=False, patience=1) == first
+
+def _daily(n:int = 120) -> pl.DataFrame:
+    rng = np.random.default_rng(0)
+    start = datetime.date(2020, 1, 1)
+    return pl.DataFrame({"ds": pl.date_range(start, start + datetime.timedelta(days=n-1), eager=True),
+                         "y": 50 + 10 * np.sin(np.arange(n) / 3) + rng.normal(size=n),
+                         "x": rng.normal(size=n)})
+
+def test_quiet_stan_restores_loggers():
+    logger = logging.getLogger("cmdstanpy")
+    state = logger.disabled
+    with _quiet_stan():
+        assert logger.disabled
+    assert logger.disabled == state
+
+def test_quick_prophet_warm_start_and_exog():
+    data = _daily()
+    res, model = quickProphet(data, "ds", "y", n_periods=5, quiet=True, return_model=True)
+    assert res.get().height == data.height + 5
+    init = prophet_init(model)
+    assert set(init) == {"k", "m", "sigma_obs", "delta", "beta"}
+    warm = quickProphet(data, "ds", "y", n_periods=5, quiet=True, init=model, freq="D")
+    assert np.allclose(warm.get()["yhat"].tail(5).to_numpy(), 
+                       res.get()["yhat"].tail(5).to_numpy(), rtol=1e-2)
+    future = pl.DataFrame({"x": np.zeros(5)})
+    with_exog = quickProphet(data, "ds", "y", exog=["x"], future_exog=future, n_periods=5,
+                             quiet=True, fit_kwargs={"algorithm": "Newton"})
+    assert with_exog.get()["yhat"].tail(5).is_not_null().all()
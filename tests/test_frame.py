@@ -0,0 +1,180 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import polars as pl
+
+from pytoolsz.frame import frameCache
+
+def _source(folder:Path, n:int = 1000) -> Path:
+    src = folder/"data.csv"
+    pl.DataFrame({"a": range(n), "b": [str(i) for i in range(n)]}).write_csv(src)
+    return src
+
+def test_frame_cache_hit_and_miss():
+    with TemporaryDirectory() as tmp:
+        src = _source(Path(tmp))
+        cache = frameCache(Path(tmp)/"cache")
+        first = cache.load(src, lambda: pl.read_csv(src))
+        second = cache.load(src, lambda: pl.read_csv(src))
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert first.equals(second)
+
+def test_frame_cache_skips_entry_larger_than_limit():
+    with TemporaryDirectory() as tmp:
+        src = _source(Path(tmp))
+        cache = frameCache(Path(tmp)/"cache", max_bytes=100)
+        res = cache.load(src, lambda: pl.read_csv(src))
+        assert res.height == 1000
+        assert cache.load(src, lambda: pl.read_csv(src), lazy=True).collect().equals(res)
+        assert cache.size() == 0
+
+def test_frame_cache_evicts_older_entries_first():
+    with TemporaryDirectory() as tmp:
+        src = _source(Path(tmp))
+        cache = frameCache(Path(tmp)/"cache")
+        cache.load(src, lambda: pl.read_csv(src), columns="a")
+        one = cache.size()
+        cache.max_bytes = one + one // 2
+        cache.load(src, lambda: pl.read_csv(src), columns="b")
+        assert cache.sidecar(src, columns="b").exists()
+        assert not cache.sidecar(src, columns="a").exists()
+
+def test_zip_columns_reads_excel_member_and_caches_schema():
+    from zipfile import ZipFile
+    from pytoolsz.frame import ARCHIVE_CACHE, zipColumns
+    with TemporaryDirectory() as tmp:
+        xlsx = Path(tmp)/"data.xlsx"
+        pl.DataFrame({"a": [1, 2], "b": ["x", "y"]}).write_excel(xlsx)
+        target = Path(tmp)/"data.zip"
+        with ZipFile(target, "w") as zf:
+            zf.write(xlsx, "data.xlsx")
+        misses = ARCHIVE_CACHE.schemas.misses
+        assert zipColumns(target, "data.xlsx") == ["a", "b"]
+        assert zipColumns(target, "data.xlsx") == ["a", "b"]
+        assert ARCHIVE_CACHE.schemas.misses == misses + 1
+        ARCHIVE_CACHE.invalidate(target)
+
+def test_load_many_directory_skips_unreadable_files():
+    from pytoolsz.frame import load_many
+    with TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        pl.DataFrame({"a": [1, 2]}).write_csv(folder/"one.csv")
+        pl.DataFrame({"a": [3]}).write_parquet(folder/"two.parquet")
+        (folder/".DS_Store").write_bytes(b"\x00\x01binary")
+        (folder/"README").write_text("not data")
+        res = load_many(folder, source_column="file")
+        assert sorted(res["a"].to_list()) == [1, 2, 3]
+        assert set(res["file"]) == {"one.csv", "two.parquet"}
+
+def test_getreader_uses_last_suffix():
+    from pytoolsz.frame import getreader, read_tsv
+    assert getreader("data.parquet") is pl.read_parquet
+    assert getreader("data.v1.parquet") is pl.read_parquet
+    assert getreader("archive.parquet.csv") is pl.read_csv
+    assert getreader("data.tsv") is read_tsv
+    assert getreader("data.xlsx") is pl.read_excel
+    assert getreader(".hidden") is pl.read_csv
+    assert getreader("noext") is pl.read_csv
+    assert getreader("data.unknown") is pl.read_csv
+    assert getreader("data.txt", used_by="parquet") is pl.read_parquet
+
+def test_getscanner_uses_last_suffix():
+    from pytoolsz.frame import getscanner
+    assert getscanner("data.v1.parquet") is pl.scan_parquet
+    assert getscanner("DATA.PARQUET") is pl.scan_parquet
+    assert getscanner(".hidden") is pl.scan_csv
+    assert getscanner("data.unknown") is pl.scan_csv
+
+def test_probe_schema_reads_header_once_per_file_version():
+    from pytoolsz.frame import SCHEMA_REGISTRY, checkExpr, dataframeColumns, optExpr, probe_schema
+    with TemporaryDirectory() as tmp:
+        src = Path(tmp)/"data.tsv"
+        src.write_text("a\tb\n1\tx\n2\ty\n", encoding="utf-8")
+        pq = Path(tmp)/"data.parquet"
+        pl.DataFrame({"x": [1.0], "y": [2]}).write_parquet(pq)
+        assert probe_schema(pq) == pl.Schema({"x": pl.Float64, "y": pl.Int64})
+        misses, hits = SCHEMA_REGISTRY.misses, SCHEMA_REGISTRY.hits
+        assert dataframeColumns(src) == ["a", "b"]
+        assert checkExpr(pl.col("a"), src)
+        assert not checkExpr([pl.col("a"), pl.col("z")], src)
+        assert optExpr([pl.col("b"), pl.col("z")], src)[0].meta.root_names() == ["b"]
+        assert (SCHEMA_REGISTRY.misses - misses, SCHEMA_REGISTRY.hits - hits) == (1, 3)
+        src.write_text("a\tb\tc\n1\tx\t0\n", encoding="utf-8")
+        assert dataframeColumns(src) == ["a", "b", "c"]
+        SCHEMA_REGISTRY.invalidate(src)
+        SCHEMA_REGISTRY.invalidate(pq)
+
+def test_iter_batches_and_slices_cover_all_rows():
+    from pytoolsz.frame import _lazy_slices, _rebatch, szDataFrame
+    with TemporaryDirectory() as tmp:
+        src = _source(Path(tmp), n=2500)
+        eager = szDataFrame(src)
+        lazy = szDataFrame(src, lazy=True)
+        for data in (eager, lazy):
+            batches = list(data.iter_batches(batch_size=1000))
+            assert [x.height for x in batches] == [1000, 1000, 500]
+            assert pl.concat(batches).equals(eager.get())
+            slices = list(data.iter_slices(n_rows=1000))
+            assert [x.height for x in slices] == [1000, 1000, 500]
+        assert [x.height for x in _lazy_slices(eager.lazy(), 1250)] == [1250, 1250]
+        frames = [eager.get().slice(0, 300), eager.get().slice(300, 1700)]
+        assert [x.height for x in _rebatch(frames, 800)] == [800, 800, 400]
+
+def test_pandas_conversion_is_cached_per_mode():
+    from pytoolsz.frame import set_pandas_arrow, szDataFrame, use_pandas_arrow
+    data = szDataFrame(None, from_data=pl.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+    numpy_df = data.get("pandas", arrow=False)
+    assert data.convert("pandas", arrow=False) is numpy_df
+    arrow_df = data.get("pandas", arrow=True)
+    assert arrow_df is not numpy_df
+    assert str(arrow_df["a"].dtype) == "int64[pyarrow]"
+    assert str(numpy_df["a"].dtype) == "int64"
+    default = use_pandas_arrow()
+    set_pandas_arrow(True)
+    try :
+        assert data.get("pandas") is arrow_df
+    finally :
+        set_pandas_arrow(default)
+
+def _tsv(folder:Path) -> Path:
+    src = folder/"data.tsv"
+    src.write_text('id\tname\tvalue\n1\t"quoted\t2.5\n2\tplain\t3.0\n', encoding="utf-8")
+    return src
+
+def test_read_tsv_defaults_to_strings():
+    from io import BytesIO
+    from pytoolsz.frame import read_tsv, scan_tsv
+    with TemporaryDirectory() as tmp:
+        src = _tsv(Path(tmp))
+        res = read_tsv(src)
+        assert res.schema == pl.Schema({"id": pl.String, "name": pl.String, "value": pl.String})
+        assert res["name"].to_list() == ['"quoted', "plain"]
+        assert read_tsv(src, memory_map=True).equals(res)
+        assert read_tsv(BytesIO(src.read_bytes())).equals(res)
+        assert scan_tsv(src).collect().equals(res)
+
+def test_read_tsv_infer_and_schema():
+    from pytoolsz.frame import read_tsv
+    with TemporaryDirectory() as tmp:
+        src = _tsv(Path(tmp))
+        assert read_tsv(src, infer_schema=True).schema == pl.Schema(
+            {"id": pl.Int64, "name": pl.String, "value": pl.Float64})
+        res = read_tsv(src, schema={"value": pl.Float32})
+        assert res.schema["value"] == pl.Float32 and res.schema["id"] == pl.Int64
@@ -0,0 +1,41 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+import subprocess
+import sys
+
+def _run(code:str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    return out.stdout.strip()
+
+def test_saveExcel_is_class_after_submodule_import():
+    res = _run("from pytoolsz.saveExcel import transColname2Letter\n"
+               "import pytoolsz\n"
+               "from pytoolsz import saveExcel\n"
+               "print(isinstance(pytoolsz.saveExcel, type), isinstance(saveExcel, type))")
+    assert res == "True True"
+
+def test_saveExcel_is_class_on_plain_import():
+    res = _run("import pytoolsz, pytoolsz.saveExcel\n"
+               "print(isinstance(pytoolsz.saveExcel, type))")
+    assert res == "True"
+
+def test_heavy_submodules_stay_lazy():
+    res = _run("import sys, pytoolsz\n"
+               "print(any(x in sys.modules for x in ['pytoolsz.forecast', 'pytoolsz.graph']))")
+    assert res == "False"
@@ -0,0 +1,170 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import openpyxl
+import polars as pl
+
+from pytoolsz.saveExcel import STYLE_REGISTRY, cellBorder, save_many, saveExcel, styleRegistry
+
+def _data(ncols:int = 3) -> pl.DataFrame:
+    return pl.DataFrame({"c{}".format(i): [i * 1.5, 2.0, 3.25] for i in range(ncols)})
+
+def test_columns_width_accepts_name_and_letter():
+    with TemporaryDirectory() as tmp:
+        target = Path(tmp)/"width.xlsx"
+        book = saveExcel(target, startColumn=2)
+        book.actionNewSheet("s")
+        book.usingData(_data())
+        book.setColumnsWidth(30, colname="B")
+        book.setColumnsWidth(40, colname="c2")
+        book.writeData()
+        book.save()
+        ws = openpyxl.load_workbook(target).active
+        assert ws.column_dimensions["B"].width == 30
+        assert ws.column_dimensions["D"].width == 40
+
+_THICK = {"border_style": "thick"}
+_EDGES = {"left": {"left": _THICK}, "middle": {"top": _THICK}, "right": {"right": _THICK}}
+
+def _report(target:Path, data:pl.DataFrame, write_only:bool) -> None:
+    with saveExcel(target, startRow=2, startColumn=2, write_only=write_only) as book:
+        book.usingData(data)
+        book.actionNewSheet(sheetname="报表")
+        book.setColumnsWidth(20)
+        book.writeTitle("标题", crossline=1, border_type=_EDGES)
+        book.writeData(col_crossline=1, 
+                       col_font_type={"fill": {"patternType": "solid", "fgColor": "000066CC"},
+                                      "font": {"bold": True, "color": "00FFFFFF"}},
+                       col_border_type=_EDGES, font_type={"font": {"size": 11.5}},
+                       borde_type=_EDGES, numberformat={"C": "0.00%"})
+        book.writeSummaryData(name_merge_cols=["c0"], numberformat={"D": "0.0"},
+                              font_type={"fill": {"patternType": "solid", "fgColor": "00CCFFCC"}},
+                              borde_type=_EDGES)
+
+def _cells(target:Path) -> list[tuple]:
+    ws = openpyxl.load_workbook(target).active
+    res = [ws.title, sorted(map(str, ws.merged_cells.ranges))]
+    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, max_col=ws.max_column):
+        for x in row:
+            res.append((x.coordinate, x.value, x.number_format, x.font.b, x.fill.fgColor.rgb,
+                        x.alignment.horizontal, x.border.left.style, x.border.right.style, 
+                        x.border.top.style))
+    return res
+
+def test_write_only_matches_normal_mode():
+    data = _data(4)
+    with TemporaryDirectory() as tmp:
+        normal, streamed = Path(tmp)/"normal.xlsx", Path(tmp)/"streamed.xlsx"
+        _report(normal, data, write_only=False)
+        _report(streamed, data, write_only=True)
+        assert _cells(normal) == _cells(streamed)
+        assert openpyxl.load_workbook(streamed).active.column_dimensions["B"].width == 20
+
+def test_bulk_rows_keep_values_and_styles():
+    data = pl.DataFrame({"name": ["a", None, "c", "d"] * 50, 
+                         "value": [1.5, 2.0, None, 4.0] * 50,
+                         "count": list(range(200))})
+    for write_only in (False, True):
+        with TemporaryDirectory() as tmp:
+            target = Path(tmp)/"bulk.xlsx"
+            with saveExcel(target, startRow=3, startColumn=2, write_only=write_only) as book:
+                book.usingData(data)
+                book.actionNewSheet("s")
+                book.writeData(font_type={"font": {"size": 11.5}}, borde_type=_EDGES,
+                               numberformat={"value": "0.00"})
+            ws = openpyxl.load_workbook(target).active
+            assert [x.value for x in ws[3][1:4]] == ["name", "value", "count"]
+            rows = [[x.value for x in row] for row in ws.iter_rows(min_row=4, min_col=2, max_col=4)]
+            assert rows == [list(x) for x in data.iter_rows()]
+            assert {ws.cell(r, 3).number_format for r in range(4, 204)} == {"0.00"}
+            assert {ws.cell(r, 2).font.size for r in range(4, 204)} == {11.5}
+            assert ws.cell(4, 2).border.left.style == "thick"
+            assert ws.cell(203, 4).border.right.style == "thick"
+            assert ws.cell(100, 3).border.top.style == "thick"
+
+def test_style_registry_reuses_equal_styles():
+    registry = styleRegistry()
+    font = registry.font(name="Arial", size=11, bold=True)
+    assert registry.font(bold=True, size=11, name="Arial") is font
+    assert registry.font(name="Arial", size=12, bold=True) is not font
+    border = registry.border({"left": {"border_style": "thick"}})
+    assert registry.border({"left": {"border_style": "thick"}}) is border
+    assert border.left.style == "thick" and border.right.style == "dotted"
+    assert registry.allocated["Font"] == 2 and registry.allocated["Border"] == 1
+    assert registry.hits >= 2
+    registry.clear()
+    assert len(registry) == 0 and registry.hits == 0
+
+def test_report_styles_come_from_shared_registry():
+    with TemporaryDirectory() as tmp:
+        _report(Path(tmp)/"one.xlsx", _data(4), write_only=False)
+        size = len(STYLE_REGISTRY)
+        _report(Path(tmp)/"two.xlsx", _data(4), write_only=True)
+        assert len(STYLE_REGISTRY) == size
+    assert cellBorder(_EDGES["left"]) is cellBorder(_EDGES["left"])
+
+def test_multiple_sheets_and_switch_back():
+    data = _data(2)
+    for write_only in (False, True):
+        with TemporaryDirectory() as tmp:
+            target = Path(tmp)/"sheets.xlsx"
+            book = saveExcel(target, write_only=write_only)
+            book.usingData(data)
+            book.actionNewSheet("A")
+            book.writeTitle("A表")
+            book.writeData()
+            book.actionNewSheet("B")
+            book.writeData()
+            book.switchSheet("A")
+            book.writeSummaryData()
+            assert book.sheetnames == ["A", "B"]
+            book.save()
+            wb = openpyxl.load_workbook(target)
+            assert wb.sheetnames == ["A", "B"]
+            assert wb["A"].max_row == 6 and wb["B"].max_row == 4
+            assert wb["A"]["A6"].value is not None
+
+def _jobs(folder:Path) -> list[tuple]:
+    data = _data(2)
+    steps = [("actionNewSheet", {"sheetname": "结算"}), ("writeTitle", {"title": "t"}),
+             ("writeData", {}), ("writeSummaryData", {})]
+    jobs = [(data, {"filename": str(folder/"j{}.xlsx".format(i)), "write_only": i == 1, 
+                    "steps": steps}) for i in range(2)]
+    jobs.append(({"x": data, "y": data.head(2)}, 
+                 {"filename": str(folder/"multi.xlsx"),
+                  "steps": [("actionNewSheet", {"sheetname": "x"}), ("usingData", {"data": "x"}),
+                            ("writeData", {}), ("actionNewSheet", {"sheetname": "y"}),
+                            ("usingData", {"data": "y"}), ("writeData", {})]}))
+    jobs.append((data, {"filename": str(folder/"bad.xlsx"), "steps": [("save", {})]}))
+    return jobs
+
+def test_save_many_reports_each_job():
+    with TemporaryDirectory() as tmp:
+        done = []
+        res = save_many(_jobs(Path(tmp)), progress=lambda i, n, x: done.append((i, n)))
+        assert done == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        assert res["sheets"].to_list() == [1, 1, 2, 0]
+        assert res["rows"].to_list() == [3, 3, 5, 3]
+        assert res["error"].to_list()[:3] == [None, None, None]
+        assert res["error"][3].startswith("ValueError")
+        assert openpyxl.load_workbook(Path(tmp)/"multi.xlsx").sheetnames == ["x", "y"]
+        assert not (Path(tmp)/"bad.xlsx").exists()
+        parallel = save_many(_jobs(Path(tmp)), n_workers=2)
+        assert parallel.drop("seconds").equals(res.drop("seconds"))
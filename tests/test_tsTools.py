@@ -0,0 +1,64 @@
+#  ____       _____           _
+# |  _ \ _   |_   _|__   ___ | |___ ____
+# | |_) | | | || |/ _ \ / _ \| / __|_  /
+# |  __/| |_| || | (_) | (_) | \__ \/ /
+# |_|    \__, ||_|\___/ \___/|_|___/___|
+#        |___/
+
+# Copyright (c) 2024 Sidney Zhang <zly@lyzhang.me>
+# PyToolsz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+import pandas as pd
+import polars as pl
+
+from pytoolsz.tsTools import tsFrame
+
+def _frame(dates:pd.DatetimeIndex) -> tsFrame:
+    data = pl.DataFrame({"dt": pl.Series(dates.to_numpy()).cast(pl.Date), 
+                         "y": list(range(len(dates)))})
+    return tsFrame(data, "dt", "y")
+
+def _future(ts:tsFrame, n:int) -> list:
+    return [x.date() for x in ts.make_future_dataframe(n)["ds"]]
+
+def test_business_day_future_skips_weekends():
+    dates = pd.bdate_range("2024-01-22", "2024-02-09")
+    ts = _frame(dates)
+    assert ts.calendar.regular
+    assert ts.calendar.gaps.height == 0
+    expected = pd.bdate_range(dates[-1], periods=6)[1:]
+    assert _future(ts, 5) == [x.date() for x in expected]
+
+def test_business_day_gap_excludes_weekends():
+    dates = pd.bdate_range("2024-02-01", periods=20).delete([5])
+    ts = _frame(dates)
+    assert ts.calendar.freq == "B"
+    assert ts.calendar.gaps["missing"].to_list() == [1]
+    assert ts.upsample().to_polars().height == 20
+
+def test_month_end_future_stays_on_month_end():
+    dates = pd.date_range("2023-03-31", periods=12, freq="ME")
+    ts = _frame(dates)
+    expected = pd.date_range(dates[-1], periods=6, freq="ME")[1:]
+    assert _future(ts, 5) == [x.date() for x in expected]
+
+def test_month_end_gap():
+    dates = pd.date_range("2023-01-31", periods=12, freq="ME").delete([3, 4])
+    ts = _frame(dates)
+    assert ts.calendar.gaps["missing"].to_list() == [2]
+    filled = ts.upsample().to_polars()["dt"]
+    assert filled.to_list() == [x.date() for x in pd.date_range("2023-01-31", periods=12, freq="ME")]
+
+def test_to_pandas_is_cached_per_mode():
+    ts = _frame(pd.date_range("2024-01-01", periods=5, freq="D"))
+    res = ts.to_pandas(arrow=False)
+    assert ts.to_pandas(arrow=False) is res
+    assert res["y"].tolist() == [0, 1, 2, 3, 4]
+    assert str(ts.to_pandas(arrow=True)["y"].dtype) == "int64[pyarrow]"